@@ -1,10 +1,21 @@
 """Makr - 대칭 전력 마우스/키보드 자동화 GUI."""
 
-from makr.ui.app import MakrApplication, build_gui
+from makr._lazy import lazy_exports
 from makr.main import main
 
-__all__ = [
+# Public names resolved lazily (PEP 562) so `import makr` does not pull in
+# tkinter, pyautogui or pynput until the GUI is actually requested.
+# `main` is imported eagerly: a lazy entry would be shadowed by the
+# makr.main submodule once it is imported.
+_LAZY = {
+    "MakrApplication": "makr.ui.app",
+    "build_gui": "makr.ui.app",
+}
+
+__all__ = (
     "MakrApplication",
     "build_gui",
     "main",
-]
+)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -0,0 +1,32 @@
+"""Shared PEP 562 helpers for lazily resolved package re-exports."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    module_name: str, table: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__``/``__dir__`` hooks for a re-export table.
+
+    ``table`` maps each exported name to the module that defines it. The
+    defining module is imported on first access and the value is cached in
+    the re-exporting module's namespace, so later lookups skip the hook.
+    """
+    namespace = sys.modules[module_name].__dict__
+
+    def __getattr__(name: str) -> Any:
+        source = table.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(table))
+
+    return __getattr__, __dir__
@@ -3,28 +3,31 @@
 This module re-exports from the new modular structure for backward compatibility.
 """
 
-from __future__ import annotations
-
-# Re-export everything from the new locations for backward compatibility
-from makr.core.config import DelayConfig, UiTwoDelayConfig
-from makr.core.persistence import (
-    APP_STATE_PATH,
-    NEW_CHANNEL_SOUND_PATH,
-    load_app_state,
-    save_app_state,
-)
-from makr.core.tasks import RepeatingTask, RepeatingClickTask, RepeatingActionTask
-from makr.core.sound import SoundPlayer, BeepNotifier
-from makr.core.channel import ChannelSegmentRecorder
-from makr.controllers.macro_controller import MacroController
-from makr.ui.app import MakrApplication, build_gui
+import importlib
 
-import pyautogui
+from makr._lazy import lazy_exports
 
-# Restore pyautogui setting
-pyautogui.PAUSE = 0
+# Re-exported names and the modules they now live in. Resolved lazily
+# (PEP 562) so importing one symbol does not load the whole application.
+_REEXPORTS = {
+    "DelayConfig": "makr.core.config",
+    "UiTwoDelayConfig": "makr.core.config",
+    "APP_STATE_PATH": "makr.core.persistence",
+    "NEW_CHANNEL_SOUND_PATH": "makr.core.persistence",
+    "load_app_state": "makr.core.persistence",
+    "save_app_state": "makr.core.persistence",
+    "RepeatingTask": "makr.core.tasks",
+    "RepeatingClickTask": "makr.core.tasks",
+    "RepeatingActionTask": "makr.core.tasks",
+    "SoundPlayer": "makr.core.sound",
+    "BeepNotifier": "makr.core.sound",
+    "ChannelSegmentRecorder": "makr.core.channel",
+    "MacroController": "makr.controllers.macro_controller",
+    "MakrApplication": "makr.ui.app",
+    "build_gui": "makr.ui.app",
+}
 
-__all__ = [
+__all__ = (
     "DelayConfig",
     "UiTwoDelayConfig",
     "APP_STATE_PATH",
@@ -40,7 +43,27 @@ __all__ = [
     "MacroController",
     "MakrApplication",
     "build_gui",
-]
+)
+
+__getattr__, __dir__ = lazy_exports(__name__, _REEXPORTS)
+
+
+def prewarm() -> None:
+    """Resolve every re-export in one pass, importing each source module once."""
+    grouped: dict[str, list[str]] = {}
+    for name, module_name in _REEXPORTS.items():
+        grouped.setdefault(module_name, []).append(name)
+    for module_name, names in grouped.items():
+        module = importlib.import_module(module_name)
+        globals().update({name: getattr(module, name) for name in names})
+
 
 if __name__ == "__main__":
+    import sys
+
+    # Register this module under its package name so a later
+    # `import makr.app` reuses it instead of executing the file again.
+    sys.modules.setdefault("makr.app", sys.modules[__name__])
+
+    prewarm()
     build_gui()
@@ -1,11 +1,19 @@
 """Controllers connecting UI and Core layers."""
 
-from makr.controllers.macro_controller import MacroController
-from makr.controllers.ui2_controller import UI2Controller
-from makr.controllers.channel_detection import ChannelDetectionSequence
+from makr._lazy import lazy_exports
 
-__all__ = [
+# Resolved lazily (PEP 562) so importing one controller module does not
+# initialize the others.
+_LAZY = {
+    "MacroController": "makr.controllers.macro_controller",
+    "UI2Controller": "makr.controllers.ui2_controller",
+    "ChannelDetectionSequence": "makr.controllers.channel_detection",
+}
+
+__all__ = (
     "MacroController",
     "UI2Controller",
     "ChannelDetectionSequence",
-]
+)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import threading
 import time
-import tkinter as tk
+from concurrent.futures import Future
 from queue import Empty, Queue
-from typing import Callable, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from makr.controllers.macro_controller import MacroController
@@ -17,21 +17,26 @@ class ChannelDetectionSequence:
 
     def __init__(
         self,
-        root: tk.Tk,
-        status_var: tk.StringVar,
+        post_to_main: Callable[..., None],
+        set_status_async: Callable[[str], None],
         controller: "MacroController",
         get_channel_timeout_ms: Callable[[], int],
         get_channel_watch_interval_ms: Callable[[], int],
     ) -> None:
-        self.root = root
-        self.status_var = status_var
+        # post_to_main(func, *args) runs func on the Tk main loop.
+        self.post_to_main = post_to_main
+        self.set_status_async = set_status_async
         self.controller = controller
         self.get_channel_timeout_ms = get_channel_timeout_ms
         self.get_channel_watch_interval_ms = get_channel_watch_interval_ms
         self.running = False
-        self.detection_queue: Queue[tuple[float, bool]] = Queue()
+        # None is a wake-up sentinel posted by stop().
+        self.detection_queue: Queue[tuple[float, bool] | None] = Queue()
         self.newline_mode = False
         self.last_detected_at: float | None = None
+        # Delay settings in seconds, refreshed on the main thread each cycle.
+        self._timeout_sec = 0.0
+        self._watch_interval_sec = 0.0
 
     def start(self, newline_mode: bool) -> None:
         """Start the detection sequence."""
@@ -50,6 +55,7 @@ class ChannelDetectionSequence:
         """Stop the detection sequence."""
         self.running = False
         self._clear_queue()
+        self.detection_queue.put(None)
         self.last_detected_at = None
 
     def notify_channel_found(
@@ -61,53 +67,66 @@ class ChannelDetectionSequence:
         timestamp = detected_at or time.time()
         self.detection_queue.put((timestamp, is_new))
 
-    def _run_on_main(self, func: Callable[[], None]) -> None:
-        """Run a function on the main thread and wait for completion."""
-        done = threading.Event()
+    def _run_on_main(self, func: Callable[[], Any]) -> Any:
+        """Run a function on the main thread, wait for completion and return its result."""
+        future: Future[Any] = Future()
+        self.post_to_main(self._resolve_on_main, future, func)
+        return future.result()
 
-        def _wrapper() -> None:
-            try:
-                func()
-            finally:
-                done.set()
-
-        self.root.after(0, _wrapper)
-        done.wait()
+    @staticmethod
+    def _resolve_on_main(future: "Future[Any]", func: Callable[[], Any]) -> None:
+        """Call func on the main thread and publish its result to the waiting worker."""
+        try:
+            result = func()
+        except BaseException:
+            # Unblock the worker; Tk reports the error as before.
+            future.set_result(None)
+            raise
+        future.set_result(result)
+
+    def _run_macro(self, func: Callable[[], "Future[None] | None"]) -> None:
+        """Start a macro step on the main thread and wait until its input finishes."""
+        future = self._run_on_main(func)
+        if future is not None:
+            future.result()
 
     def _set_status(self, message: str) -> None:
         """Set status message asynchronously."""
-        self.root.after(0, self.status_var.set, message)
+        self.set_status_async(message)
 
     def _clear_queue(self) -> None:
         """Clear the detection queue."""
-        while True:
-            try:
-                self.detection_queue.get_nowait()
-            except Empty:
-                break
+        queue = self.detection_queue
+        with queue.mutex:
+            queue.queue.clear()
+            queue.unfinished_tasks = 0
+            queue.all_tasks_done.notify_all()
 
     def _wait_for_detection(self, timeout_sec: float) -> tuple[float, bool] | None:
-        """Wait for a detection event with timeout."""
-        if timeout_sec <= 0:
-            try:
+        """Wait for a detection event with timeout.
+
+        Returns None on timeout or when stop() wakes the wait early.
+        """
+        try:
+            if timeout_sec <= 0:
                 return self.detection_queue.get_nowait()
-            except Empty:
-                return None
-
-        deadline = time.time() + timeout_sec
-        while self.running:
-            remaining = deadline - time.time()
-            if remaining <= 0:
-                return None
-            try:
-                return self.detection_queue.get(timeout=remaining)
-            except Empty:
-                continue
-        return None
+            return self.detection_queue.get(timeout=timeout_sec)
+        except Empty:
+            return None
 
     def _delay_seconds(self, delay_ms: int) -> float:
         """Convert milliseconds to seconds."""
-        return max(delay_ms, 0) / 1000
+        return delay_ms / 1000 if delay_ms > 0 else 0.0
+
+    def _start_cycle(self) -> "Future[None] | None":
+        """Read the delay settings and start F2 (main thread only).
+
+        The getters validate their Tk variables and may show a messagebox,
+        so they are never called from the sequence worker.
+        """
+        self._timeout_sec = self._delay_seconds(self.get_channel_timeout_ms())
+        self._watch_interval_sec = self._delay_seconds(self.get_channel_watch_interval_ms())
+        return self.controller.reset_and_run_first(newline_mode=self.newline_mode)
 
     def _run_sequence(self) -> None:
         """Run the main detection sequence."""
@@ -115,15 +134,10 @@ class ChannelDetectionSequence:
             while self.running:
                 self._set_status("F10: F2 기능 실행 중…")
                 self._clear_queue()
-                self._run_on_main(
-                    lambda: self.controller.reset_and_run_first(
-                        newline_mode=self.newline_mode
-                    )
-                )
+                self._run_macro(self._start_cycle)
 
                 self._set_status("F10: 채널명 감시 중…")
-                timeout_sec = self._delay_seconds(self.get_channel_timeout_ms())
-                first_detection = self._wait_for_detection(timeout_sec)
+                first_detection = self._wait_for_detection(self._timeout_sec)
                 self.last_detected_at = first_detection[0] if first_detection else None
 
                 if not self.running:
@@ -136,12 +150,12 @@ class ChannelDetectionSequence:
                 first_time, is_new = first_detection
                 if is_new:
                     self._set_status("F10: 새 채널명 기록, F1 실행 중…")
-                    self._run_on_main(
+                    self._run_macro(
                         lambda: self.controller.run_step(newline_mode=self.newline_mode)
                     )
                     break
 
-                watch_interval = self._delay_seconds(self.get_channel_watch_interval_ms())
+                watch_interval = self._watch_interval_sec
                 if watch_interval <= 0:
                     self._set_status("F10: 새 채널명이 없어 재시작합니다…")
                     continue
@@ -173,7 +187,7 @@ class ChannelDetectionSequence:
 
                 if new_channel_found:
                     self._set_status("F10: 새 채널명 기록, F1 실행 중…")
-                    self._run_on_main(
+                    self._run_macro(
                         lambda: self.controller.run_step(newline_mode=self.newline_mode)
                     )
                     break
@@ -181,4 +195,5 @@ class ChannelDetectionSequence:
                 self._set_status("F10: 새 채널명이 없어 재시작합니다…")
         finally:
             self.running = False
-            self._run_on_main(self.controller._update_status)
+            # Nothing runs after this on the worker, so don't wait for it.
+            self.post_to_main(self.controller._update_status)
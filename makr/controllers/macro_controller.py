@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import tkinter as tk
+from concurrent.futures import Future
+from functools import partial
 from typing import Callable, Protocol
 
-import pyautogui
 from tkinter import messagebox
 
 from makr.core.config import DelayConfig
+from makr.core.input import (
+    cancel_input,
+    get_fast_click,
+    get_fast_press,
+    input_cancel_event,
+    submit_input,
+)
+
+# (delay before the action in ms, action) pairs run in order on the input worker
+Schedule = list[tuple[int, Callable[[], None]]]
 
 
 class CoordinateProvider(Protocol):
@@ -30,20 +42,27 @@ class EntryCoordinateProvider:
     ) -> None:
         self.entries = entries
         self.label_map = label_map
+        # key -> ((x_text, y_text), parsed point) for the last valid read
+        self._parsed: dict[str, tuple[tuple[str, str], tuple[int, int]]] = {}
 
     def get_point(self, key: str) -> tuple[int, int] | None:
         """Get coordinates from entry widgets."""
-        if key not in self.entries:
+        entry_pair = self.entries.get(key)
+        if entry_pair is None:
             return None
-        x_entry, y_entry = self.entries[key]
-        label = self.label_map.get(key, key)
+        x_entry, y_entry = entry_pair
+        texts = (x_entry.get(), y_entry.get())
+        cached = self._parsed.get(key)
+        if cached is not None and cached[0] == texts:
+            return cached[1]
         try:
-            x_val = int(x_entry.get())
-            y_val = int(y_entry.get())
+            point = (int(texts[0]), int(texts[1]))
         except ValueError:
+            label = self.label_map.get(key, key)
             messagebox.showerror("좌표 오류", f"{label} 좌표를 정수로 입력해주세요.")
             return None
-        return x_val, y_val
+        self._parsed[key] = (texts, point)
+        return point
 
 
 class MacroController:
@@ -77,80 +96,110 @@ class MacroController:
     def _click_point(self, point: tuple[int, int], *, label: str | None = None) -> None:
         """Click at the given point."""
         x_val, y_val = point
-        pyautogui.click(x_val, y_val)
+        get_fast_click()(x_val, y_val)
 
     def _press_key(self, key: str, *, label: str | None = None) -> None:
         """Press the given keyboard key."""
-        pyautogui.press(key)
+        get_fast_press()(key)
 
     def _delay_seconds(self, delay_ms: int) -> float:
         """Convert milliseconds to seconds."""
-        return max(delay_ms, 0) / 1000
+        return delay_ms / 1000 if delay_ms > 0 else 0.0
+
+    def _run_schedule(self, schedule: Schedule, cancel: threading.Event) -> None:
+        """Run each action after its delay, timed from a single monotonic start.
+
+        Delays are relative to the previous action, but every wait targets the
+        cumulative deadline, so time spent inside the actions themselves does
+        not push later steps back. Stops early once cancel is set.
+        """
+        started_at = time.monotonic()
+        deadline = 0.0
+        for delay_ms, action in schedule:
+            deadline += self._delay_seconds(delay_ms)
+            remaining = deadline - (time.monotonic() - started_at)
+            if remaining > 0:
+                if cancel.wait(remaining):
+                    return
+            elif cancel.is_set():
+                return
+            action()
 
-    def _sleep_ms(self, delay_ms: int) -> None:
-        """Sleep for the given milliseconds."""
-        delay_sec = self._delay_seconds(delay_ms)
-        if delay_sec:
-            time.sleep(delay_sec)
+    def run_step(self, *, newline_mode: bool = False) -> "Future[None] | None":
+        """Execute the current step and advance to the next.
 
-    def run_step(self, *, newline_mode: bool = False) -> None:
-        """Execute the current step and advance to the next."""
+        Coordinates and delays are read on the calling (Tk) thread; the
+        clicks and waits run on the input worker. Returns the worker future,
+        or None if nothing was dispatched.
+        """
         if self.current_step == 1:
-            self._run_step_one()
+            schedule = self._prepare_step_one()
             self.current_step = 2
         else:
-            self._run_step_two(newline_mode=newline_mode)
+            schedule = self._prepare_step_two(newline_mode=newline_mode)
             self.current_step = 1
         self._update_status()
+        return self._dispatch(schedule)
 
-    def reset_and_run_first(self, *, newline_mode: bool = False) -> None:
-        """Reset with Esc and re-run step 1."""
-        self._sleep_ms(self.delay_config.f2_before_esc())
+    def reset_and_run_first(self, *, newline_mode: bool = False) -> "Future[None] | None":
+        """Abort any running steps, reset with Esc and re-run step 1."""
+        self.cancel()
+        delay_esc = self.delay_config.f2_before_esc()
         if self.use_esc_click():
             esc_point = self._get_point("esc_click")
             if esc_point is None:
-                return
-            self._click_point(esc_point, label="초기화 Esc 클릭")
+                return None
+            reset_action = partial(self._click_point, esc_point, label="초기화 Esc 클릭")
         else:
-            self._press_key("esc", label="초기화 ESC")
-        self.current_step = 1
-        self._update_status()
-        self._run_step_one()
+            reset_action = partial(self._press_key, "esc", label="초기화 ESC")
+        schedule: Schedule = [(delay_esc, reset_action)]
+        schedule.extend(self._prepare_step_one() or ())
+
         self.current_step = 2
         self._update_status()
+        return self._dispatch(schedule)
+
+    def cancel(self) -> None:
+        """Abort the schedules that are running or queued on the input worker."""
+        cancel_input()
 
-    def _run_step_one(self) -> None:
-        """Execute step 1: click pos1 then pos2."""
+    def _dispatch(self, schedule: Schedule | None) -> "Future[None] | None":
+        """Run a prepared schedule on the input worker thread."""
+        if schedule is None:
+            return None
+        return submit_input(partial(self._run_schedule, schedule, input_cancel_event()))
+
+    def _prepare_step_one(self) -> Schedule | None:
+        """Prepare step 1: click pos1 then pos2."""
         pos1 = self._get_point("pos1")
         pos2 = self._get_point("pos2")
         if pos1 is None or pos2 is None:
-            return
-        self._sleep_ms(self.delay_config.f2_before_pos1())
-        self._click_point(pos1, label="1단계 pos1")
-        self._sleep_ms(self.delay_config.f2_before_pos2())
-        self._click_point(pos2, label="1단계 pos2")
-
-    def _run_step_two(self, *, newline_mode: bool = False) -> None:
-        """Execute step 2: click pos3 and enter, with optional newline mode."""
+            return None
+        return [
+            (self.delay_config.f2_before_pos1(), partial(self._click_point, pos1, label="1단계 pos1")),
+            (self.delay_config.f2_before_pos2(), partial(self._click_point, pos2, label="1단계 pos2")),
+        ]
+
+    def _prepare_step_two(self, *, newline_mode: bool = False) -> Schedule | None:
+        """Prepare step 2: click pos3 and enter, with optional newline mode."""
         pos3 = self._get_point("pos3")
         if pos3 is None:
-            return
+            return None
         repeat_count = max(self.delay_config.f1_repeat_count(), 1)
+        click_pos3 = partial(self._click_point, pos3, label="2단계 pos3")
+        press_enter = partial(self._press_key, "enter", label="2단계 Enter")
         if newline_mode:
             pos4 = self._get_point("pos4")
             if pos4 is None:
-                return
-        for _ in range(repeat_count):
-            if newline_mode:
-                self._sleep_ms(self.delay_config.f1_newline_before_pos4())
-                self._click_point(pos4, label="2단계 pos4")
-                self._sleep_ms(self.delay_config.f1_newline_before_pos3())
-            else:
-                self._sleep_ms(self.delay_config.f1_before_pos3())
-            self._click_point(pos3, label="2단계 pos3")
-            self._sleep_ms(
-                self.delay_config.f1_newline_before_enter()
-                if newline_mode
-                else self.delay_config.f1_before_enter()
-            )
-            self._press_key("enter", label="2단계 Enter")
+                return None
+            cycle: Schedule = [
+                (self.delay_config.f1_newline_before_pos4(), partial(self._click_point, pos4, label="2단계 pos4")),
+                (self.delay_config.f1_newline_before_pos3(), click_pos3),
+                (self.delay_config.f1_newline_before_enter(), press_enter),
+            ]
+        else:
+            cycle = [
+                (self.delay_config.f1_before_pos3(), click_pos3),
+                (self.delay_config.f1_before_enter(), press_enter),
+            ]
+        return cycle * repeat_count
@@ -7,17 +7,17 @@ import time
 import tkinter as tk
 from typing import Callable
 
-import pyautogui
 from tkinter import messagebox
 
 from makr.core.config import UiTwoDelayConfig
+from makr.core.input import get_fast_click, get_fast_press
 from makr.core.tasks import RepeatingTask
 from makr.core.state import UI2AutomationState
 
 
 def _sleep_ms(delay_ms: int) -> None:
     """Sleep for the given milliseconds."""
-    delay_sec = max(delay_ms, 0) / 1000
+    delay_sec = delay_ms / 1000 if delay_ms > 0 else 0.0
     if delay_sec:
         time.sleep(delay_sec)
 
@@ -70,13 +70,15 @@ class UI2Controller:
             return None
         delay_between = self.delay_config.f4_between_pos11_pos12()
         delay_before_enter = self.delay_config.f4_before_enter()
+        click = get_fast_click()
+        press = get_fast_press()
 
         def _run() -> None:
-            pyautogui.click(*pos11)
+            click(*pos11)
             _sleep_ms(delay_between)
-            pyautogui.click(*pos12)
+            click(*pos12)
             _sleep_ms(delay_before_enter)
-            pyautogui.press("enter")
+            press("enter")
 
         return _run
 
@@ -89,15 +91,24 @@ class UI2Controller:
         start_message: str | None = None,
         stop_message: str | None = None,
     ) -> None:
-        """Run F4 action in a batch."""
+        """Run F4 action in a batch.
+
+        Runs start on a fixed cadence measured from the first one, so the
+        time each action takes does not stretch the batch.
+        """
         if start_message:
             self.status_fn(start_message)
+        interval = max(interval_sec, 0)
 
         def _run() -> None:
+            next_fire = time.perf_counter()
             for idx in range(max(repeat_count, 1)):
                 action()
                 if idx < repeat_count - 1:
-                    time.sleep(max(interval_sec, 0))
+                    next_fire += interval
+                    remaining = next_fire - time.perf_counter()
+                    if remaining > 0:
+                        time.sleep(remaining)
             if stop_message:
                 self.status_fn(stop_message)
 
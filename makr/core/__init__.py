@@ -1,29 +1,57 @@
 """Core business logic layer - UI independent components."""
 
-from makr.core.config import DelayConfig, UiTwoDelayConfig
-from makr.core.persistence import (
-    APP_STATE_PATH,
-    NEW_CHANNEL_SOUND_PATH,
-    load_app_state,
-    save_app_state,
-)
-from makr.core.tasks import RepeatingTask
-from makr.core.sound import SoundPlayer, BeepNotifier
-from makr.core.state import DevLogicState, UI2AutomationState
-from makr.core.channel import ChannelSegmentRecorder, format_devlogic_packet
+from makr._lazy import lazy_exports
+
+# Resolved lazily (PEP 562) so importing one core module, e.g.
+# makr.core.config, does not initialize every other core module.
+_LAZY = {
+    "DelayConfig": "makr.core.config",
+    "UiTwoDelayConfig": "makr.core.config",
+    "APP_STATE_PATH": "makr.core.persistence",
+    "NEW_CHANNEL_SOUND_PATH": "makr.core.persistence",
+    "load_app_state": "makr.core.persistence",
+    "save_app_state": "makr.core.persistence",
+    "saved_coordinates": "makr.core.persistence",
+    "write_app_state": "makr.core.persistence",
+    "RepeatingTask": "makr.core.tasks",
+    "ensure_pyautogui": "makr.core.input",
+    "get_fast_click": "makr.core.input",
+    "get_fast_press": "makr.core.input",
+    "submit_input": "makr.core.input",
+    "input_cancel_event": "makr.core.input",
+    "cancel_input": "makr.core.input",
+    "shutdown_input": "makr.core.input",
+    "SoundPlayer": "makr.core.sound",
+    "BeepNotifier": "makr.core.sound",
+    "DevLogicState": "makr.core.state",
+    "UI2AutomationState": "makr.core.state",
+    "ChannelSegmentRecorder": "makr.core.channel",
+    "format_devlogic_packet": "makr.core.channel",
+}
 
-__all__ = [
+__all__ = (
     "DelayConfig",
     "UiTwoDelayConfig",
     "APP_STATE_PATH",
     "NEW_CHANNEL_SOUND_PATH",
     "load_app_state",
     "save_app_state",
+    "saved_coordinates",
+    "write_app_state",
     "RepeatingTask",
+    "ensure_pyautogui",
+    "get_fast_click",
+    "get_fast_press",
+    "submit_input",
+    "input_cancel_event",
+    "cancel_input",
+    "shutdown_input",
     "SoundPlayer",
     "BeepNotifier",
     "DevLogicState",
     "UI2AutomationState",
     "ChannelSegmentRecorder",
     "format_devlogic_packet",
-]
+)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
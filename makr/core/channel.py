@@ -3,9 +3,31 @@
 from __future__ import annotations
 
 import re
+import string
 import time
 from typing import Callable
 
+_NORMALIZE_RE = re.compile(r"[^A-Za-z0-9가-힣]")
+# ASCII-only equivalent of _NORMALIZE_RE for str.translate
+_ASCII_NORMALIZE_TABLE = str.maketrans(
+    {
+        chr(code): "-"
+        for code in range(128)
+        if chr(code) not in string.ascii_letters + string.digits
+    }
+)
+_CHANNEL_RE = re.compile(r"[A-Z]-[가-힣]\d{2,3}-")
+_ALPHA_RE = re.compile(r"[A-Za-z]")
+_DIGIT_RE = re.compile(r"[0-9]")
+_KOREAN_RE = re.compile(r"[가-힣]")
+
+
+def _normalize_text(text: str) -> str:
+    """Replace every character other than A-Z, a-z, 0-9 and 가-힣 with a hyphen."""
+    if text.isascii():
+        return text.translate(_ASCII_NORMALIZE_TABLE)
+    return _NORMALIZE_RE.sub("-", text)
+
 
 def format_devlogic_packet(packet_text: str) -> tuple[str, bool, bool]:
     """Format a DevLogic packet and determine channel type.
@@ -18,13 +40,13 @@ def format_devlogic_packet(packet_text: str) -> tuple[str, bool, bool]:
         return "", False, False
     segment_start = start + len("DevLogic")
     segment = packet_text[segment_start : segment_start + 25]
-    sanitized = re.sub(r"[^0-9A-Za-z가-힣]", "-", segment)
+    sanitized = _normalize_text(segment)
     display = sanitized[:25]
     if not display:
         return "", False, False
-    has_alpha = bool(re.search(r"[A-Za-z]", display))
-    has_digit = bool(re.search(r"[0-9]", display))
-    has_korean = bool(re.search(r"[가-힣]", display))
+    has_alpha = _ALPHA_RE.search(display) is not None
+    has_digit = _DIGIT_RE.search(display) is not None
+    has_korean = _KOREAN_RE.search(display) is not None
     is_normal_channel = has_alpha and has_digit and has_korean
     is_new_channel = not is_normal_channel
     return display, is_new_channel, is_normal_channel
@@ -34,6 +56,9 @@ class ChannelSegmentRecorder:
     """Records and parses channel name segments from packet data."""
 
     anchor_keyword = "ChannelName"
+    # A channel code is at most 7 characters ("A-가123-"), so once the anchor
+    # has been seen only the last 6 unmatched characters can start a match.
+    _pattern_overlap = 6
 
     def __init__(
         self,
@@ -43,12 +68,12 @@ class ChannelSegmentRecorder:
         self._on_capture = on_capture
         self._on_channel_activity = on_channel_activity
         self._buffer = ""
-        self._pattern = re.compile(r"[A-Z]-[가-힣]\d{2,3}-")
+        self._anchored = False
 
     @staticmethod
     def _normalize(text: str) -> str:
         """Normalize text by replacing non-alphanumeric characters with hyphens."""
-        return re.sub(r"[^A-Za-z0-9가-힣]", "-", text)
+        return _normalize_text(text)
 
     def feed(self, text: str) -> None:
         """Feed packet data to the recorder."""
@@ -61,25 +86,34 @@ class ChannelSegmentRecorder:
         self._process_buffer()
 
     def _process_buffer(self) -> None:
-        """Process the internal buffer looking for channel patterns."""
+        """Process the internal buffer looking for channel patterns.
+
+        Only a short unmatched tail is carried between feeds, so the cost of
+        each feed is proportional to the new data, not the pending buffer.
+        """
+        buffer = self._buffer
+        pos = 0
         while True:
-            anchor_idx = self._buffer.find(self.anchor_keyword)
-            if anchor_idx == -1:
-                # Keep only the tail to avoid missing partial keywords
-                self._buffer = self._buffer[-len(self.anchor_keyword) :]
-                return
+            if not self._anchored:
+                anchor_idx = buffer.find(self.anchor_keyword, pos)
+                if anchor_idx == -1:
+                    # Keep only the tail to avoid missing partial keywords
+                    self._buffer = buffer[max(pos, len(buffer) - len(self.anchor_keyword)) :]
+                    return
+                self._anchored = True
+                pos = anchor_idx + len(self.anchor_keyword)
             if self._on_channel_activity is not None:
                 self._on_channel_activity(time.time())
 
-            search_start = anchor_idx + len(self.anchor_keyword)
-            match = self._pattern.search(self._buffer, pos=search_start)
+            match = _CHANNEL_RE.search(buffer, pos)
             if match is None:
-                # Keep from anchor onwards for next feed
-                self._buffer = self._buffer[anchor_idx:]
+                # Keep just enough after the anchor to complete a split code
+                self._buffer = buffer[max(pos, len(buffer) - self._pattern_overlap) :]
                 return
 
             captured = match.group(0).replace("-", "")
             self._on_capture(captured)
 
             # Continue processing from after the match
-            self._buffer = self._buffer[match.end() :]
+            self._anchored = False
+            pos = match.end()
@@ -6,10 +6,24 @@ from dataclasses import dataclass
 from typing import Callable
 
 
-@dataclass
+# slots=True needs Python 3.10; none of the fields have defaults, so the
+# __slots__ can be spelled out by hand instead.
+@dataclass(frozen=True)
 class DelayConfig:
     """UI1 (채변) delay configuration callbacks."""
 
+    __slots__ = (
+        "f2_before_esc",
+        "f2_before_pos1",
+        "f2_before_pos2",
+        "f1_before_pos3",
+        "f1_before_enter",
+        "f1_repeat_count",
+        "f1_newline_before_pos4",
+        "f1_newline_before_pos3",
+        "f1_newline_before_enter",
+    )
+
     f2_before_esc: Callable[[], int]
     f2_before_pos1: Callable[[], int]
     f2_before_pos2: Callable[[], int]
@@ -21,10 +35,17 @@ class DelayConfig:
     f1_newline_before_enter: Callable[[], int]
 
 
-@dataclass
+@dataclass(frozen=True)
 class UiTwoDelayConfig:
     """UI2 (월재) delay configuration callbacks."""
 
+    __slots__ = (
+        "f4_between_pos11_pos12",
+        "f4_before_enter",
+        "f5_interval",
+        "f6_interval",
+    )
+
     f4_between_pos11_pos12: Callable[[], int]
     f4_before_enter: Callable[[], int]
     f5_interval: Callable[[], int]
@@ -47,3 +68,8 @@ DEFAULT_DELAY_F5_INTERVAL_MS = 25
 DEFAULT_DELAY_F6_INTERVAL_MS = 25
 DEFAULT_CHANNEL_WATCH_INTERVAL_MS = 20
 DEFAULT_CHANNEL_TIMEOUT_MS = 700
+
+# Beep notification (winsound) settings
+BEEP_FREQUENCY_HZ = 1200
+BEEP_TONE_MS = 200
+BEEP_BLOCK_MS = 50
@@ -0,0 +1,134 @@
+"""Lazy access to the pyautogui mouse/keyboard backend."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+_pyautogui: "ModuleType | None" = None
+_fast_click: Callable[[int, int], None] | None = None
+_fast_press: Callable[[str], None] | None = None
+_input_executor: ThreadPoolExecutor | None = None
+# Set to abort every input sequence submitted while it was current.
+_input_cancel = threading.Event()
+
+
+def ensure_pyautogui() -> "ModuleType":
+    """Import and configure pyautogui on first use.
+
+    pyautogui pulls in the screenshot and platform backends, so it is only
+    loaded once something actually needs to click or press a key.
+    """
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
+
+        # Disable pyautogui's default delay and tween/fail-safe handling;
+        # macros are stopped with hotkeys, not by moving to a screen corner.
+        pyautogui.PAUSE = 0
+        pyautogui.FAILSAFE = False
+        pyautogui.MINIMUM_DURATION = 0
+        pyautogui.MINIMUM_SLEEP = 0
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+def get_fast_click() -> Callable[[int, int], None]:
+    """Return a primary-button click function bound to the pyautogui backend.
+
+    The returned callable skips pyautogui's checks and tweening, so the
+    cursor jumps straight to the target. Like ``pyautogui.click``, the
+    primary button follows the system's swapped-buttons setting. Falls back
+    to ``pyautogui.click`` if the backend does not expose the expected hooks.
+    """
+    global _fast_click
+    if _fast_click is None:
+        pyautogui = ensure_pyautogui()
+        backend = getattr(pyautogui, "platformModule", None)
+        move_to = getattr(backend, "_moveTo", None)
+        mouse_down = getattr(backend, "_mouseDown", None)
+        mouse_up = getattr(backend, "_mouseUp", None)
+        if move_to is None or mouse_down is None or mouse_up is None:
+            _fast_click = pyautogui.click
+        else:
+            # pyautogui maps PRIMARY to LEFT or RIGHT on every call, so a
+            # change to the swapped-buttons setting applies immediately.
+            normalize = getattr(pyautogui, "_normalizeButton", None)
+
+            def _click(x: int, y: int) -> None:
+                button = (
+                    normalize(pyautogui.PRIMARY) if normalize else pyautogui.LEFT
+                )
+                move_to(x, y)
+                mouse_down(x, y, button)
+                mouse_up(x, y, button)
+
+            _fast_click = _click
+    return _fast_click
+
+
+def get_fast_press() -> Callable[[str], None]:
+    """Return a key-press function bound to the pyautogui platform backend.
+
+    Like ``get_fast_click``, this skips pyautogui's per-call checks and
+    pause handling. Key names are passed through as-is, so callers must use
+    pyautogui's lower-case names (``"enter"``, ``"esc"``). Falls back to
+    ``pyautogui.press`` if the backend does not expose the expected hooks.
+    """
+    global _fast_press
+    if _fast_press is None:
+        pyautogui = ensure_pyautogui()
+        backend = getattr(pyautogui, "platformModule", None)
+        key_down = getattr(backend, "_keyDown", None)
+        key_up = getattr(backend, "_keyUp", None)
+        if key_down is None or key_up is None:
+            _fast_press = pyautogui.press
+        else:
+
+            def _press(key: str) -> None:
+                key_down(key)
+                key_up(key)
+
+            _fast_press = _press
+    return _fast_press
+
+
+def submit_input(action: Callable[[], None]) -> "Future[None]":
+    """Run an input sequence on the shared input worker thread.
+
+    Sequences run one at a time in submission order, so macro steps never
+    interleave and their delays do not block the Tk main loop.
+    """
+    global _input_executor
+    if _input_executor is None:
+        _input_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="makr-input")
+    return _input_executor.submit(action)
+
+
+def input_cancel_event() -> threading.Event:
+    """Return the event that input sequences should poll between steps."""
+    return _input_cancel
+
+
+def cancel_input() -> None:
+    """Abort the running and queued input sequences.
+
+    Sequences holding the previous event stop at their next step; anything
+    submitted afterwards runs normally.
+    """
+    global _input_cancel
+    cancelled, _input_cancel = _input_cancel, threading.Event()
+    cancelled.set()
+
+
+def shutdown_input() -> None:
+    """Abort all input and stop the worker without waiting for it."""
+    global _input_executor
+    _input_cancel.set()
+    if _input_executor is not None:
+        _input_executor.shutdown(wait=False, cancel_futures=True)
+        _input_executor = None
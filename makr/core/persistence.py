@@ -6,7 +6,11 @@ import json
 import os
 import sys
 from pathlib import Path
-from tkinter import messagebox
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
 
 
 def _get_user_state_path() -> Path:
@@ -49,15 +53,48 @@ def load_app_state() -> dict:
     if not APP_STATE_PATH.exists():
         return {}
     try:
+        if orjson is not None:
+            return orjson.loads(APP_STATE_PATH.read_bytes())
         return json.loads(APP_STATE_PATH.read_text(encoding="utf-8"))
     except (OSError, json.JSONDecodeError):
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         return {}
 
 
+def saved_coordinates(state: dict) -> dict[str, tuple[str, str]]:
+    """Return the saved coordinates as a flat key -> (x, y) string map."""
+    coordinates = state.get("coordinates") or {}
+    return {
+        key: (str(coords.get("x", "0")), str(coords.get("y", "0")))
+        for key, coords in coordinates.items()
+        if isinstance(coords, dict) and coords
+    }
+
+
+def write_app_state(state: dict) -> None:
+    """Write application state to the JSON file, raising OSError on failure.
+
+    The file is written next to the target and swapped in with os.replace,
+    so an interrupted write never leaves a truncated state file behind.
+    """
+    APP_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = APP_STATE_PATH.with_name(APP_STATE_PATH.name + ".tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(
+            orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        tmp_path.write_text(
+            json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    os.replace(tmp_path, APP_STATE_PATH)
+
+
 def save_app_state(state: dict) -> None:
     """Save application state to the JSON file."""
     try:
-        APP_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        APP_STATE_PATH.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_app_state(state)
     except OSError:
+        from tkinter import messagebox
+
         messagebox.showwarning("설정 저장", "입력값을 저장하는 중 오류가 발생했습니다.")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
 import importlib.util
 import subprocess
@@ -9,10 +10,22 @@ import sys
 import threading
 import time
 from pathlib import Path
+from queue import Full, Queue
 from typing import TYPE_CHECKING
 
+from makr.core.config import BEEP_BLOCK_MS, BEEP_FREQUENCY_HZ, BEEP_TONE_MS
+
 if TYPE_CHECKING:
     import tkinter as tk
+    from types import ModuleType
+
+
+@functools.lru_cache(maxsize=None)
+def _get_winsound() -> "ModuleType | None":
+    """Return the winsound module, or None where it is unavailable."""
+    if importlib.util.find_spec("winsound") is None:
+        return None
+    return importlib.import_module("winsound")
 
 
 class SoundPlayer:
@@ -21,24 +34,30 @@ class SoundPlayer:
     def __init__(self, sound_path: Path, *, volume: float = 1.0) -> None:
         self._sound_path = sound_path
         self._volume = max(0.0, min(volume, 1.0))
-        self._winsound = (
-            importlib.import_module("winsound")
-            if importlib.util.find_spec("winsound")
-            else None
-        )
+        self._winsound = _get_winsound()
         self._cached_wav_bytes: bytes | None = None
+        self._wav_load_failed = False
+        self._play_requests: Queue[None] = Queue(maxsize=1)
+        self._worker: threading.Thread | None = None
+
+    def preload(self) -> None:
+        """Load the scaled WAV data in the background so the first play is instant."""
+        if self._winsound is None or self._cached_wav_bytes is not None or self._wav_load_failed:
+            return
+        threading.Thread(target=self._load_scaled_wav, daemon=True).start()
 
     def _load_scaled_wav(self) -> bytes | None:
         """Load and scale the WAV file volume."""
         if self._cached_wav_bytes is not None:
             return self._cached_wav_bytes
-        if not self._sound_path.exists():
+        if self._wav_load_failed or not self._sound_path.exists():
             return None
         try:
             import audioop
             import io
             import wave
         except ImportError:
+            self._wav_load_failed = True
             return None
         try:
             with wave.open(str(self._sound_path), "rb") as wav_file:
@@ -52,6 +71,7 @@ class SoundPlayer:
                 output_wav.writeframes(frames)
             self._cached_wav_bytes = buffer.getvalue()
         except (OSError, wave.Error):
+            self._wav_load_failed = True
             return None
         return self._cached_wav_bytes
 
@@ -62,44 +82,54 @@ class SoundPlayer:
         suffix = self._sound_path.suffix.lower()
         if suffix != ".wav":
             return
-
-        def _run() -> None:
-            if self._winsound is not None:
-                wav_bytes = self._load_scaled_wav()
-                if wav_bytes is not None:
-                    self._winsound.PlaySound(
-                        wav_bytes,
-                        self._winsound.SND_MEMORY | self._winsound.SND_ASYNC,
-                    )
-                    return
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+        try:
+            self._play_requests.put_nowait(None)
+        except Full:
+            # A play is already pending; the alert will sound once.
+            pass
+
+    def _run_worker(self) -> None:
+        """Serve play requests on a single long-lived thread."""
+        while True:
+            self._play_requests.get()
+            self._play()
+
+    def _play(self) -> None:
+        """Play the sound file on the current thread."""
+        if self._winsound is not None:
+            wav_bytes = self._load_scaled_wav()
+            if wav_bytes is not None:
                 self._winsound.PlaySound(
-                    str(self._sound_path),
-                    self._winsound.SND_FILENAME | self._winsound.SND_ASYNC,
+                    wav_bytes,
+                    self._winsound.SND_MEMORY | self._winsound.SND_ASYNC,
                 )
                 return
-            if sys.platform == "darwin":
-                subprocess.run(
-                    ["afplay", "-v", f"{self._volume:.2f}", str(self._sound_path)],
-                    check=False,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-
-        threading.Thread(target=_run, daemon=True).start()
+            self._winsound.PlaySound(
+                str(self._sound_path),
+                self._winsound.SND_FILENAME | self._winsound.SND_ASYNC,
+            )
+            return
+        if sys.platform == "darwin":
+            subprocess.run(
+                ["afplay", "-v", f"{self._volume:.2f}", str(self._sound_path)],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
 
 
 class BeepNotifier:
     """Plays system beeps for a specified duration."""
 
-    def __init__(self, root_widget: "tk.Tk") -> None:
+    def __init__(self, root_widget: "tk.Tk", *, block_ms: int = BEEP_BLOCK_MS) -> None:
         self._root = root_widget
+        self._block_ms = max(1, min(block_ms, BEEP_TONE_MS))
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
-        self._winsound = (
-            importlib.import_module("winsound")
-            if importlib.util.find_spec("winsound")
-            else None
-        )
+        self._winsound = _get_winsound()
 
     def start(self, duration_sec: float = 3.0) -> None:
         """Start beeping for the specified duration."""
@@ -110,7 +140,7 @@ class BeepNotifier:
             end_time = time.time() + max(duration_sec, 0)
             while time.time() < end_time and not self._stop_event.is_set():
                 if self._winsound is not None:
-                    self._winsound.Beep(1200, 200)
+                    self._beep_tone()
                 else:
                     self._root.after(0, self._root.bell)
                 if self._stop_event.wait(0.1):
@@ -119,6 +149,13 @@ class BeepNotifier:
         self._thread = threading.Thread(target=_run, daemon=True)
         self._thread.start()
 
+    def _beep_tone(self) -> None:
+        """Sound one tone in short blocks so stop() takes effect quickly."""
+        for _ in range(max(BEEP_TONE_MS // self._block_ms, 1)):
+            if self._stop_event.is_set():
+                return
+            self._winsound.Beep(BEEP_FREQUENCY_HZ, self._block_ms)
+
     def stop(self) -> None:
         """Stop the beeping."""
         if self._thread is None:
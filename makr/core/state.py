@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @dataclass
@@ -77,10 +77,15 @@ class UI2RecordItem:
 
 @dataclass
 class TestRecord:
-    """Test window record item."""
+    """Test window record item.
+
+    ``name_count`` is how many channel names had been extracted when the
+    record was added, and ``col_width`` the longest of them; its pattern
+    table is derived from that prefix on demand instead of being stored
+    with every record.
+    """
 
     timestamp: str
     content: str
-    table_text: str | None
-    display_content: str
-    table_rows: list[list[str]] = field(default_factory=list)
+    name_count: int
+    col_width: int
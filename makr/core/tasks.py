@@ -3,9 +3,30 @@
 from __future__ import annotations
 
 import threading
+import time
+from functools import partial
 from typing import Callable
 
-import pyautogui
+from makr.core.input import get_fast_click
+
+# Intervals shorter than this are timed by spinning over the last
+# _SPIN_MARGIN_SEC, because Event.wait can overshoot by a whole timer tick.
+_SPIN_THRESHOLD_SEC = 0.010
+_SPIN_MARGIN_SEC = 0.002
+
+
+def _wait_until(stop_event: threading.Event, deadline: float) -> bool:
+    """Wait until a perf_counter deadline, sleeping first and then spinning.
+
+    Returns True if the stop event was set before the deadline.
+    """
+    coarse = deadline - time.perf_counter() - _SPIN_MARGIN_SEC
+    if coarse > 0 and stop_event.wait(coarse):
+        return True
+    while time.perf_counter() < deadline:
+        if stop_event.is_set():
+            return True
+    return stop_event.is_set()
 
 
 class RepeatingTask:
@@ -24,23 +45,62 @@ class RepeatingTask:
         start_message: str,
         stop_message: str,
     ) -> None:
-        """Start the repeating task with a custom action."""
-        self.stop()
-        self._stop_event.clear()
-
-        def _run() -> None:
-            self._status_fn(start_message)
-            try:
-                while not self._stop_event.is_set():
-                    action()
-                    if self._stop_event.wait(max(interval_sec, 0)):
-                        break
-            finally:
-                self._status_fn(stop_message)
+        """Start the repeating task with a custom action.
+
+        Actions fire on a fixed cadence measured from the start, so the time
+        an action itself takes does not stretch the interval.
+        """
+        self._start(action, interval_sec, start_message, stop_message)
 
-        self._thread = threading.Thread(target=_run, daemon=True)
+    def _start(
+        self,
+        action: Callable[[], None],
+        interval_sec: float,
+        start_message: str,
+        stop_message: str,
+    ) -> None:
+        """Start the worker thread; shared by start() and start_click()."""
+        self.stop()
+        # A fresh event per run: a thread that is still winding down keeps
+        # the (set) event it was started with.
+        stop_event = self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(action, max(interval_sec, 0), stop_event, start_message, stop_message),
+            daemon=True,
+        )
         self._thread.start()
 
+    def _run(
+        self,
+        action: Callable[[], None],
+        interval: float,
+        stop_event: threading.Event,
+        start_message: str,
+        stop_message: str,
+    ) -> None:
+        """Worker loop: fire action every interval until stop_event is set."""
+        precise = interval < _SPIN_THRESHOLD_SEC
+        self._status_fn(start_message)
+        try:
+            next_fire = time.perf_counter()
+            while not stop_event.is_set():
+                action()
+                next_fire += interval
+                remaining = next_fire - time.perf_counter()
+                if remaining < -interval:
+                    # More than a full period behind: resync instead of
+                    # firing a burst of catch-up actions.
+                    next_fire = time.perf_counter()
+                    remaining = 0
+                if precise:
+                    if _wait_until(stop_event, next_fire):
+                        break
+                elif stop_event.wait(max(remaining, 0)):
+                    break
+        finally:
+            self._status_fn(stop_message)
+
     def start_click(
         self,
         point: tuple[int, int],
@@ -50,17 +110,8 @@ class RepeatingTask:
         stop_message: str,
     ) -> None:
         """Start the repeating task with mouse clicks."""
-        delay_sec = max(delay_ms, 0) / 1000
-
-        def click_action() -> None:
-            pyautogui.click(*point)
-
-        self.start(
-            click_action,
-            delay_sec,
-            start_message=start_message,
-            stop_message=stop_message,
-        )
+        delay_sec = delay_ms / 1000 if delay_ms > 0 else 0.0
+        self._start(partial(get_fast_click(), *point), delay_sec, start_message, stop_message)
 
     def stop(self, *, stop_message: str | None = None) -> bool:
         """Stop the repeating task. Returns True if it was running."""
@@ -79,7 +130,7 @@ class RepeatingTask:
 
 # Backward compatibility aliases
 class RepeatingClickTask(RepeatingTask):
-    """Backward compatible class for click-specific repeating tasks."""
+    """Backward compatible class whose start() takes a point and delay in ms."""
 
     def start(  # type: ignore[override]
         self,
@@ -98,7 +149,4 @@ class RepeatingClickTask(RepeatingTask):
         )
 
 
-class RepeatingActionTask(RepeatingTask):
-    """Backward compatible class for action-specific repeating tasks."""
-
-    pass
+RepeatingActionTask = RepeatingTask
@@ -0,0 +1,32 @@
+"""Headless entry point.
+
+Re-exports the UI-independent core (configuration, state, channel parsing
+and persistence) without importing tkinter, pynput, pyautogui or audio
+backends. Scripts and tests should import from here rather than from
+``makr`` or ``makr.app``.
+"""
+
+from makr.core.config import DelayConfig, UiTwoDelayConfig
+from makr.core.persistence import (
+    APP_STATE_PATH,
+    load_app_state,
+    save_app_state,
+    saved_coordinates,
+    write_app_state,
+)
+from makr.core.state import DevLogicState, UI2AutomationState
+from makr.core.channel import ChannelSegmentRecorder, format_devlogic_packet
+
+__all__ = (
+    "DelayConfig",
+    "UiTwoDelayConfig",
+    "APP_STATE_PATH",
+    "load_app_state",
+    "save_app_state",
+    "saved_coordinates",
+    "write_app_state",
+    "DevLogicState",
+    "UI2AutomationState",
+    "ChannelSegmentRecorder",
+    "format_devlogic_packet",
+)
@@ -1,12 +1,12 @@
 """Entry point for the Makr application."""
 
-from makr.ui.app import MakrApplication
-
 
 def main() -> None:
     """Main entry point."""
-    app = MakrApplication()
-    app.run()
+    # Imported here so `import makr` stays cheap; the GUI stack loads on launch.
+    from makr.ui.app import build_gui
+
+    build_gui()
 
 
 if __name__ == "__main__":
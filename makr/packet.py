@@ -2,14 +2,25 @@ from __future__ import annotations
 
 """Scapy를 활용한 패킷 캡쳐 관리."""
 
+import functools
 import threading
-from typing import Callable
+from typing import Any, Callable
 
 
 class PacketCaptureError(RuntimeError):
     """패킷 캡쳐 초기화 실패 시 사용되는 예외."""
 
 
+@functools.lru_cache(maxsize=None)
+def _load_scapy() -> tuple[Any, Any] | None:
+    """scapy의 (AsyncSniffer, Raw)를 한 번만 로드한다. 미설치 시 None."""
+    try:
+        from scapy.all import AsyncSniffer, Raw
+    except Exception:  # pragma: no cover - scapy 미설치 환경
+        return None
+    return AsyncSniffer, Raw
+
+
 class PacketCaptureManager:
     """지정된 포트의 패킷을 캡쳐한다."""
 
@@ -43,11 +54,11 @@ class PacketCaptureManager:
         with self._lock:
             if self._is_running(self._sniffer):
                 return True
-        try:
-            from scapy.all import AsyncSniffer, Raw
-        except Exception:  # pragma: no cover - scapy 미설치 환경
+        scapy = _load_scapy()
+        if scapy is None:
             self._on_error("scapy가 설치되어 있지 않아 패킷 캡쳐를 시작할 수 없습니다.")
             return False
+        AsyncSniffer, Raw = scapy
 
         def handle_packet(packet) -> None:  # type: ignore[no-untyped-def]
             if not packet.haslayer(Raw):
@@ -1,5 +1,13 @@
 """UI layer - presentation components."""
 
-from makr.ui.app import MakrApplication
+from makr._lazy import lazy_exports
 
-__all__ = ["MakrApplication"]
+# Resolved lazily so importing a single widget module (e.g. makr.ui.styles)
+# does not build the whole application module graph.
+_LAZY = {
+    "MakrApplication": "makr.ui.app",
+}
+
+__all__ = ("MakrApplication",)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
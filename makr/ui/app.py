@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import tkinter as tk
+from collections import deque
+from functools import partial
 from tkinter import messagebox
-from typing import TYPE_CHECKING
-
-import pyautogui
-from pynput import keyboard
+from typing import TYPE_CHECKING, Any, Callable
 
 from makr.core.config import (
     DelayConfig,
@@ -33,7 +33,10 @@ from makr.core.persistence import (
     NEW_CHANNEL_SOUND_PATH,
     load_app_state,
     save_app_state,
+    saved_coordinates,
+    write_app_state,
 )
+from makr.core.input import shutdown_input
 from makr.core.sound import SoundPlayer, BeepNotifier
 from makr.core.channel import ChannelSegmentRecorder, format_devlogic_packet
 from makr.core.state import DevLogicState, UI2AutomationState
@@ -48,10 +51,32 @@ from makr.ui.windows.record_window import RecordWindow
 from makr.packet import PacketCaptureManager
 
 if TYPE_CHECKING:
-    from pynput import mouse
-
-# Disable pyautogui's default delay
-pyautogui.PAUSE = 0
+    from pynput import keyboard, mouse
+
+# Fallbacks for settings missing from the saved app state.
+_STATE_DEFAULTS: dict[str, Any] = {
+    "ui_mode": "1",
+    "delay_f2_before_esc_ms": DEFAULT_DELAY_F2_BEFORE_ESC_MS,
+    "delay_f2_before_pos1_ms": DEFAULT_DELAY_F2_BEFORE_POS1_MS,
+    "delay_f2_before_pos2_ms": DEFAULT_DELAY_F2_BEFORE_POS2_MS,
+    "delay_f1_before_pos3_ms": DEFAULT_DELAY_F1_BEFORE_POS3_MS,
+    "delay_f1_before_enter_ms": DEFAULT_DELAY_F1_BEFORE_ENTER_MS,
+    "f1_repeat_count": DEFAULT_F1_REPEAT_COUNT,
+    "delay_f1_newline_before_pos4_ms": DEFAULT_DELAY_F1_NEWLINE_BEFORE_POS4_MS,
+    "delay_f1_newline_before_pos3_ms": DEFAULT_DELAY_F1_NEWLINE_BEFORE_POS3_MS,
+    "delay_f1_newline_before_enter_ms": DEFAULT_DELAY_F1_NEWLINE_BEFORE_ENTER_MS,
+    "delay_f4_between_pos11_pos12_ms": DEFAULT_DELAY_F4_BETWEEN_POS11_POS12_MS,
+    "delay_f4_before_enter_ms": DEFAULT_DELAY_F4_BEFORE_ENTER_MS,
+    "delay_f5_interval_ms": DEFAULT_DELAY_F5_INTERVAL_MS,
+    "delay_f6_interval_ms": DEFAULT_DELAY_F6_INTERVAL_MS,
+    "channel_watch_interval_ms": DEFAULT_CHANNEL_WATCH_INTERVAL_MS,
+    "channel_timeout_ms": DEFAULT_CHANNEL_TIMEOUT_MS,
+    "newline_after_pos2": False,
+    "esc_click_enabled": False,
+    "pos3_mode": 1,
+    "ui2_automation_enabled": False,
+    "ui2_test_new_channel": False,
+}
 
 
 class MakrApplication:
@@ -71,85 +96,73 @@ class MakrApplication:
         self.root.attributes("-topmost", True)
 
         self.saved_state = load_app_state()
+        self.saved_coordinates = saved_coordinates(self.saved_state)
         self._capture_listener: "mouse.Listener | None" = None
         self._hotkey_listener: keyboard.Listener | None = None
+        self._hotkey_handlers: dict[keyboard.Key, Callable[[], None]] = {}
+        self._collapsible_hotkeys: tuple[Callable[[], None], ...] = ()
 
         self._init_variables()
         self._init_pos3_mode_coordinates()
         self._build_ui()
         self._init_controllers()
         self._init_packet_capture()
-        self._setup_hotkeys()
+        # pynput is imported by _setup_hotkeys; let the window draw first.
+        self.root.after_idle(self._setup_hotkeys)
 
     def _init_variables(self) -> None:
         """Initialize all tkinter variables."""
         self.status_var = tk.StringVar()
         self.devlogic_alert_var = tk.StringVar(value="")
         self.devlogic_packet_var = tk.StringVar(value="")
-        self.ui_mode = tk.StringVar(value=str(self.saved_state.get("ui_mode", "1")))
+        self._devlogic_alert_after_id: str | None = None
+        # Parsed delay/count values keyed by Tcl variable name; entries are
+        # dropped by a write trace whenever the user edits the field.
+        self._parsed_value_cache: dict[str, int] = {}
+        self._traced_value_vars: set[str] = set()
+        # Work handed from the capture and hotkey threads to the Tk main
+        # loop, drained in batches by _drain_main_events.
+        self._main_events: deque[tuple[Callable[..., None], tuple[Any, ...]]] = deque()
+        self._main_drain_lock = threading.Lock()
+        self._main_drain_scheduled = False
+        # Latest status text from worker threads; only the newest is shown.
+        self._pending_status: str | None = None
+
+        # Saved values over defaults, so each setting below is one subscript.
+        state = dict(_STATE_DEFAULTS)
+        if "click_delay_ms" in self.saved_state:
+            # Older state files stored the pos2 delay as click_delay_ms.
+            state["delay_f2_before_pos2_ms"] = self.saved_state["click_delay_ms"]
+        state.update(self.saved_state)
+        self.ui_mode = tk.StringVar(value=str(state["ui_mode"]))
 
         # UI1 delay variables
-        self.f2_before_esc_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f2_before_esc_ms", DEFAULT_DELAY_F2_BEFORE_ESC_MS))
-        )
-        self.f2_before_pos1_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f2_before_pos1_ms", DEFAULT_DELAY_F2_BEFORE_POS1_MS))
-        )
-        self.f2_before_pos2_var = tk.StringVar(
-            value=str(
-                self.saved_state.get(
-                    "delay_f2_before_pos2_ms",
-                    self.saved_state.get("click_delay_ms", DEFAULT_DELAY_F2_BEFORE_POS2_MS),
-                )
-            )
-        )
-        self.f1_before_pos3_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f1_before_pos3_ms", DEFAULT_DELAY_F1_BEFORE_POS3_MS))
-        )
-        self.f1_before_enter_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f1_before_enter_ms", DEFAULT_DELAY_F1_BEFORE_ENTER_MS))
-        )
-        self.f1_repeat_count_var = tk.StringVar(
-            value=str(self.saved_state.get("f1_repeat_count", DEFAULT_F1_REPEAT_COUNT))
-        )
-        self.f1_newline_before_pos4_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f1_newline_before_pos4_ms", DEFAULT_DELAY_F1_NEWLINE_BEFORE_POS4_MS))
-        )
-        self.f1_newline_before_pos3_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f1_newline_before_pos3_ms", DEFAULT_DELAY_F1_NEWLINE_BEFORE_POS3_MS))
-        )
-        self.f1_newline_before_enter_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f1_newline_before_enter_ms", DEFAULT_DELAY_F1_NEWLINE_BEFORE_ENTER_MS))
-        )
+        self.f2_before_esc_var = tk.StringVar(value=str(state["delay_f2_before_esc_ms"]))
+        self.f2_before_pos1_var = tk.StringVar(value=str(state["delay_f2_before_pos1_ms"]))
+        self.f2_before_pos2_var = tk.StringVar(value=str(state["delay_f2_before_pos2_ms"]))
+        self.f1_before_pos3_var = tk.StringVar(value=str(state["delay_f1_before_pos3_ms"]))
+        self.f1_before_enter_var = tk.StringVar(value=str(state["delay_f1_before_enter_ms"]))
+        self.f1_repeat_count_var = tk.StringVar(value=str(state["f1_repeat_count"]))
+        self.f1_newline_before_pos4_var = tk.StringVar(value=str(state["delay_f1_newline_before_pos4_ms"]))
+        self.f1_newline_before_pos3_var = tk.StringVar(value=str(state["delay_f1_newline_before_pos3_ms"]))
+        self.f1_newline_before_enter_var = tk.StringVar(value=str(state["delay_f1_newline_before_enter_ms"]))
 
         # UI2 delay variables
-        self.f4_between_pos11_pos12_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f4_between_pos11_pos12_ms", DEFAULT_DELAY_F4_BETWEEN_POS11_POS12_MS))
-        )
-        self.f4_before_enter_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f4_before_enter_ms", DEFAULT_DELAY_F4_BEFORE_ENTER_MS))
-        )
-        self.f5_interval_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f5_interval_ms", DEFAULT_DELAY_F5_INTERVAL_MS))
-        )
-        self.f6_interval_var = tk.StringVar(
-            value=str(self.saved_state.get("delay_f6_interval_ms", DEFAULT_DELAY_F6_INTERVAL_MS))
-        )
+        self.f4_between_pos11_pos12_var = tk.StringVar(value=str(state["delay_f4_between_pos11_pos12_ms"]))
+        self.f4_before_enter_var = tk.StringVar(value=str(state["delay_f4_before_enter_ms"]))
+        self.f5_interval_var = tk.StringVar(value=str(state["delay_f5_interval_ms"]))
+        self.f6_interval_var = tk.StringVar(value=str(state["delay_f6_interval_ms"]))
 
         # Channel detection variables
-        self.channel_watch_interval_var = tk.StringVar(
-            value=str(self.saved_state.get("channel_watch_interval_ms", DEFAULT_CHANNEL_WATCH_INTERVAL_MS))
-        )
-        self.channel_timeout_var = tk.StringVar(
-            value=str(self.saved_state.get("channel_timeout_ms", DEFAULT_CHANNEL_TIMEOUT_MS))
-        )
+        self.channel_watch_interval_var = tk.StringVar(value=str(state["channel_watch_interval_ms"]))
+        self.channel_timeout_var = tk.StringVar(value=str(state["channel_timeout_ms"]))
 
         # Mode variables
-        self.newline_var = tk.BooleanVar(value=bool(self.saved_state.get("newline_after_pos2", False)))
-        self.esc_click_var = tk.BooleanVar(value=bool(self.saved_state.get("esc_click_enabled", False)))
+        self.newline_var = tk.BooleanVar(value=bool(state["newline_after_pos2"]))
+        self.esc_click_var = tk.BooleanVar(value=bool(state["esc_click_enabled"]))
 
         try:
-            pos3_mode_initial = int(self.saved_state.get("pos3_mode", 1))
+            pos3_mode_initial = int(state["pos3_mode"])
         except (TypeError, ValueError):
             pos3_mode_initial = 1
         if pos3_mode_initial not in range(1, 7):
@@ -157,10 +170,10 @@ class MakrApplication:
         self.pos3_mode_var = tk.IntVar(value=pos3_mode_initial)
 
         self.ui2_automation_var = tk.BooleanVar(
-            value=bool(self.saved_state.get("ui2_automation_enabled", False))
+            value=bool(state["ui2_automation_enabled"])
         )
         self.ui2_test_new_channel_var = tk.BooleanVar(
-            value=bool(self.saved_state.get("ui2_test_new_channel", False))
+            value=bool(state["ui2_test_new_channel"])
         )
 
         # State objects
@@ -170,18 +183,15 @@ class MakrApplication:
     def _init_pos3_mode_coordinates(self) -> None:
         """Initialize pos3 mode coordinates from saved state."""
         self.pos3_mode_coordinates: dict[int, dict[str, str]] = {}
-        saved_coordinates = self.saved_state.get("coordinates", {})
-        legacy_pos3_coords = saved_coordinates.get("pos3", {})
+        coordinates = self.saved_coordinates
+        default = ("0", "0")
 
         for mode in range(1, 7):
-            mode_key = f"pos3_{mode}"
-            coords = saved_coordinates.get(mode_key, {})
-            if not coords and mode == 1 and legacy_pos3_coords:
-                coords = legacy_pos3_coords
-            self.pos3_mode_coordinates[mode] = {
-                "x": str(coords.get("x", "0")),
-                "y": str(coords.get("y", "0")),
-            }
+            coords = coordinates.get(f"pos3_{mode}")
+            if coords is None:
+                # pos3 was saved without a mode suffix before modes existed
+                coords = coordinates.get("pos3", default) if mode == 1 else default
+            self.pos3_mode_coordinates[mode] = {"x": coords[0], "y": coords[1]}
 
     def _build_ui(self) -> None:
         """Build the main UI."""
@@ -246,7 +256,7 @@ class MakrApplication:
 
         self.ui1_panel = UI1Panel(
             panel_frame,
-            self.saved_state,
+            self.saved_coordinates,
             self.status_var,
             self.root,
             self.pos3_mode_var,
@@ -268,7 +278,7 @@ class MakrApplication:
 
         self.ui2_panel = UI2Panel(
             panel_frame,
-            self.saved_state,
+            self.saved_coordinates,
             self.status_var,
             self.root,
             self.ui2_automation_var,
@@ -342,8 +352,8 @@ class MakrApplication:
         self.ui2_controller.run_on_ui = self._run_on_ui
 
         self.channel_detection_sequence = ChannelDetectionSequence(
-            self.root,
-            self.status_var,
+            self._post_main_event,
+            self._set_status_async,
             self.macro_controller,
             self._get_channel_timeout_ms,
             self._get_channel_watch_interval_ms,
@@ -351,10 +361,12 @@ class MakrApplication:
 
         # Sound
         self.new_channel_sound_player = SoundPlayer(NEW_CHANNEL_SOUND_PATH, volume=0.5)
+        self.new_channel_sound_player.preload()
         self.beep_notifier = BeepNotifier(self.root)
 
         # Channel segment recorder
-        self.channel_segment_recorder = ChannelSegmentRecorder(self._handle_captured_pattern)
+        # Fed from the capture thread; captures are handed to the main loop.
+        self.channel_segment_recorder = ChannelSegmentRecorder(self._on_segment_captured)
 
         # UI2 automation toggle
         if self.ui2_panel.automation_checkbox:
@@ -363,8 +375,8 @@ class MakrApplication:
     def _init_packet_capture(self) -> None:
         """Initialize packet capture."""
         self.packet_manager = PacketCaptureManager(
-            on_packet=lambda text: self.root.after(0, self._process_packet_detection, text),
-            on_error=lambda msg: self.root.after(0, messagebox.showerror, "패킷 캡쳐 오류", msg),
+            on_packet=self._on_packet,
+            on_error=self._on_packet_error,
         )
         self._update_packet_capture_button()
         self.packet_capture_button.configure(command=self._toggle_packet_capture)
@@ -374,12 +386,25 @@ class MakrApplication:
         """Setup global hotkeys."""
         if self._hotkey_listener is not None:
             return
+        from pynput import keyboard
+
+        self._hotkey_handlers = {
+            keyboard.Key.f9: self._on_f9,
+            keyboard.Key.f10: self._toggle_f10,
+            keyboard.Key.f11: self._on_f11,
+            keyboard.Key.f12: self._handle_f12,
+        }
+        # F10 and F12 toggle state, so every press must be delivered.
+        self._collapsible_hotkeys = (self._on_f9, self._on_f11)
         self._hotkey_listener = keyboard.Listener(on_press=self._on_hotkey_press)
         self._hotkey_listener.start()
 
     # Helper methods
     def _parse_delay_ms(self, var: tk.StringVar, label: str, fallback: int) -> int:
         """Parse a delay value in milliseconds."""
+        cached = self._parsed_value_cache.get(str(var))
+        if cached is not None:
+            return cached
         try:
             delay_ms = int(float(var.get()))
         except (tk.TclError, ValueError):
@@ -389,14 +414,30 @@ class MakrApplication:
             messagebox.showerror(f"{label} 오류", f"{label}는 0 이상이어야 합니다.")
             delay_ms = 0
         var.set(str(delay_ms))
+        self._cache_parsed_value(var, delay_ms)
         return delay_ms
 
-    def _make_delay_getter(self, var: tk.StringVar, label: str, fallback: int):
+    def _cache_parsed_value(self, var: tk.StringVar, value: int) -> None:
+        """Remember a parsed value until the variable is written again."""
+        name = str(var)
+        if name not in self._traced_value_vars:
+            var.trace_add("write", self._invalidate_parsed_value)
+            self._traced_value_vars.add(name)
+        self._parsed_value_cache[name] = value
+
+    def _invalidate_parsed_value(self, name: str, _index: str, _mode: str) -> None:
+        """Drop the cached parse result for an edited variable."""
+        self._parsed_value_cache.pop(name, None)
+
+    def _make_delay_getter(self, var: tk.StringVar, label: str, fallback: int) -> Callable[[], int]:
         """Create a delay getter function."""
-        return lambda: self._parse_delay_ms(var, label, fallback)
+        return partial(self._parse_delay_ms, var, label, fallback)
 
     def _parse_positive_int(self, var: tk.StringVar, label: str, fallback: int) -> int:
         """Parse a positive integer value."""
+        cached = self._parsed_value_cache.get(str(var))
+        if cached is not None:
+            return cached
         try:
             value = int(float(var.get()))
         except (tk.TclError, ValueError):
@@ -406,11 +447,12 @@ class MakrApplication:
             messagebox.showerror(f"{label} 오류", f"{label}는 1 이상이어야 합니다.")
             value = 1
         var.set(str(value))
+        self._cache_parsed_value(var, value)
         return value
 
-    def _make_positive_int_getter(self, var: tk.StringVar, label: str, fallback: int):
+    def _make_positive_int_getter(self, var: tk.StringVar, label: str, fallback: int) -> Callable[[], int]:
         """Create a positive integer getter function."""
-        return lambda: self._parse_positive_int(var, label, fallback)
+        return partial(self._parse_positive_int, var, label, fallback)
 
     def _get_channel_watch_interval_ms(self) -> int:
         """Get channel watch interval in milliseconds."""
@@ -421,8 +463,24 @@ class MakrApplication:
         return self._parse_delay_ms(self.channel_timeout_var, "채널 타임아웃", DEFAULT_CHANNEL_TIMEOUT_MS)
 
     def _set_status_async(self, message: str) -> None:
-        """Set status message asynchronously."""
-        self.root.after(0, self.status_var.set, message)
+        """Set status message asynchronously.
+
+        Messages posted before the main loop gets to them are coalesced, so
+        only the latest one is applied.
+        """
+        with self._main_drain_lock:
+            pending = self._pending_status is not None
+            self._pending_status = message
+        if not pending:
+            self._post_main_event(self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Apply the latest status message posted from another thread."""
+        with self._main_drain_lock:
+            message = self._pending_status
+            self._pending_status = None
+        if message is not None:
+            self.status_var.set(message)
 
     def _get_capture_listener(self) -> "mouse.Listener | None":
         """Get the current capture listener."""
@@ -456,13 +514,16 @@ class MakrApplication:
             style_tab_button(self.tab_button_1, active=False)
             style_tab_button(self.tab_button_2, active=True)
             self.ui2_panel.pack(fill="both", expand=True)
+        self._poll_devlogic_alert()
 
     def _run_on_ui(self, mode: str, action) -> None:
         """Run an action on the specified UI."""
-        def _runner() -> None:
-            self._switch_ui(mode)
-            action()
-        self.root.after(0, _runner)
+        self._post_main_event(self._switch_and_run, mode, action)
+
+    def _switch_and_run(self, mode: str, action) -> None:
+        """Switch to the given UI and run the action (main thread)."""
+        self._switch_ui(mode)
+        action()
 
     # Pos3 mode handling
     def _set_pos3_mode(self, new_mode: int) -> None:
@@ -535,22 +596,44 @@ class MakrApplication:
         self.packet_capture_button.configure(text=text)
 
     def _start_packet_capture(self) -> None:
-        """Start packet capture."""
+        """Start packet capture.
+
+        Loading scapy and opening the capture handle can take a noticeable
+        time, so start() runs on a worker thread with the button disabled.
+        """
         if self.packet_manager.running:
             return
+        self.packet_capture_button.configure(state="disabled")
+        self.status_var.set("패킷 캡쳐를 시작하는 중…")
+        threading.Thread(
+            target=self._start_packet_capture_worker, name="makr-packet-start", daemon=True
+        ).start()
+
+    def _start_packet_capture_worker(self) -> None:
+        """Call packet_manager.start() and report back to the main loop."""
+        error: Exception | None = None
         try:
             started = self.packet_manager.start()
         except Exception as exc:
-            messagebox.showerror("패킷 캡쳐 오류", f"패킷 캡쳐 시작 실패: {exc}")
-            self._update_packet_capture_button()
-            return
-
-        if not started:
+            started = False
+            error = exc
+        try:
+            self._post_main_event(self._finish_packet_capture_start, started, error)
+        except (RuntimeError, tk.TclError):
+            # The application was closed while capture was starting.
+            pass
+
+    def _finish_packet_capture_start(self, started: bool, error: Exception | None) -> None:
+        """Report the result of a background capture start."""
+        self.packet_capture_button.configure(state="normal")
+        if error is not None:
+            messagebox.showerror("패킷 캡쳐 오류", f"패킷 캡쳐 시작 실패: {error}")
+            self.status_var.set("패킷 캡쳐를 시작하지 못했습니다.")
+        elif not started:
             messagebox.showwarning("패킷 캡쳐", "패킷 캡쳐를 시작하지 못했습니다. scapy 설치 여부를 확인하세요.")
-            self._update_packet_capture_button()
-            return
-
-        self.status_var.set("패킷 캡쳐가 시작되었습니다.")
+            self.status_var.set("패킷 캡쳐를 시작하지 못했습니다.")
+        else:
+            self.status_var.set("패킷 캡쳐가 시작되었습니다.")
         self._update_packet_capture_button()
 
     def _stop_packet_capture(self) -> None:
@@ -574,9 +657,62 @@ class MakrApplication:
             self._start_packet_capture()
 
     # Packet detection
-    def _handle_captured_pattern(self, content: str) -> None:
+    def _on_packet(self, text: str) -> None:
+        """Handle a decoded packet on the capture thread.
+
+        Channel segments are extracted here so the main loop only receives
+        packets that change the alert state and already-captured patterns.
+        """
+        if "DevLogic" in text or "AdminLevel" in text:
+            self._post_main_event(self._process_packet_detection, text)
+        self.channel_segment_recorder.feed(text)
+
+    def _on_packet_error(self, message: str) -> None:
+        """Show a packet capture error from any thread."""
+        self.root.after(0, messagebox.showerror, "패킷 캡쳐 오류", message)
+
+    def _on_segment_captured(self, content: str) -> None:
+        """Forward a captured channel pattern to the main loop."""
+        self._post_main_event(self._handle_captured_pattern, content, time.time())
+
+    def _post_main_event(self, handler: Callable[..., None], *args: Any) -> None:
+        """Queue work for the main loop, scheduling at most one pending drain."""
+        self._main_events.append((handler, args))
+        self._schedule_main_drain()
+
+    def _schedule_main_drain(self) -> None:
+        """Schedule _drain_main_events unless a drain is already pending."""
+        with self._main_drain_lock:
+            if self._main_drain_scheduled:
+                return
+            self._main_drain_scheduled = True
+        self.root.after(0, self._drain_main_events)
+
+    def _drain_main_events(self) -> None:
+        """Run all queued work in arrival order.
+
+        Back-to-back repeats of a hotkey whose action is not a toggle
+        (e.g. key auto-repeat) are run once per drain.
+        """
+        with self._main_drain_lock:
+            self._main_drain_scheduled = False
+        events = self._main_events
+        previous: tuple[Callable[..., None], tuple[Any, ...]] | None = None
+        try:
+            while events:
+                event = events.popleft()
+                if event[0] in self._collapsible_hotkeys and event == previous:
+                    continue
+                previous = event
+                handler, args = event
+                handler(*args)
+        finally:
+            # A failing handler must not strand the work queued behind it.
+            if events:
+                self._schedule_main_drain()
+
+    def _handle_captured_pattern(self, content: str, detected_at: float) -> None:
         """Handle a captured channel pattern."""
-        detected_at = time.time()
         matches, new_names = self.test_window.add_record(content)
         if matches:
             self.channel_detection_sequence.notify_channel_found(
@@ -586,7 +722,9 @@ class MakrApplication:
 
     def _process_packet_detection(self, text: str) -> None:
         """Process packet detection."""
+        alert_changed = False
         if "DevLogic" in text:
+            alert_changed = True
             self.devlogic_state.last_detected_at = time.time()
             (
                 self.devlogic_state.last_packet,
@@ -626,6 +764,7 @@ class MakrApplication:
                 self.ui2_controller.state.waiting_for_selection = False
 
         if "AdminLevel" in text:
+            alert_changed = True
             self.devlogic_state.last_detected_at = time.time()
             self.devlogic_state.last_alert_message = "선택창 감지"
             self.devlogic_state.last_alert_packet = ""
@@ -635,15 +774,24 @@ class MakrApplication:
                 self._set_status_async("선택창 감지: F6 실행 중 (F6 재입력 시 중단)")
                 self._run_on_ui("2", lambda: self.ui2_controller.run_f6(force_start=True))
 
-        self.channel_segment_recorder.feed(text)
+        if alert_changed:
+            self._poll_devlogic_alert()
 
     def _poll_devlogic_alert(self) -> None:
-        """Poll and update the devlogic alert display."""
-        interval_ms = self._get_channel_watch_interval_ms()
+        """Refresh the devlogic alert display.
+
+        Called whenever the alert state or the active tab changes. While the
+        alert is visible it reschedules itself for the next change of the
+        elapsed-seconds counter; while hidden it does not wake up at all.
+        """
+        if self._devlogic_alert_after_id is not None:
+            self.root.after_cancel(self._devlogic_alert_after_id)
+            self._devlogic_alert_after_id = None
         visible = self.ui_mode.get() == "2" and self.devlogic_state.last_detected_at is not None
 
         if visible:
-            elapsed_sec = max(0, int(time.time() - self.devlogic_state.last_detected_at))
+            elapsed = max(0.0, time.time() - self.devlogic_state.last_detected_at)
+            elapsed_sec = int(elapsed)
             elapsed_suffix = f"({elapsed_sec}초 전)"
             if self.devlogic_state.last_alert_message and self.devlogic_state.last_alert_packet:
                 self.devlogic_alert_var.set(
@@ -653,35 +801,49 @@ class MakrApplication:
                 self.devlogic_alert_var.set(f"{self.devlogic_state.last_alert_message} {elapsed_suffix}")
             else:
                 self.devlogic_alert_var.set("")
+            next_tick_ms = int((elapsed_sec + 1 - elapsed) * 1000) + 1
+            self._devlogic_alert_after_id = self.root.after(next_tick_ms, self._poll_devlogic_alert)
         else:
             self.devlogic_alert_var.set("")
         self.devlogic_packet_var.set(self.devlogic_state.last_alert_packet if visible else "")
-        self.root.after(max(interval_ms, 50), self._poll_devlogic_alert)
 
     # Hotkeys
     def _on_hotkey_press(self, key: keyboard.Key) -> None:
-        """Handle global hotkey press."""
-        if key == keyboard.Key.f9:
-            self._run_on_ui("1", self.macro_controller.reset_and_run_first)
-        elif key == keyboard.Key.f10:
-            def _toggle_f10() -> None:
-                self._switch_ui("1")
-                if self.channel_detection_sequence.running:
-                    self.channel_detection_sequence.stop()
-                    self.status_var.set("F10 매크로가 종료되었습니다.")
-                    self.macro_controller._update_status()
-                else:
-                    self.channel_detection_sequence.start(self.newline_var.get())
-            self.root.after(0, _toggle_f10)
-        elif key == keyboard.Key.f11:
-            self._run_on_ui("2", self.ui2_controller.run_f4)
-        elif key == keyboard.Key.f12:
-            def _handle_f12() -> None:
-                if self.ui2_controller.state.active and self.ui2_automation_var.get():
-                    self.ui2_controller.stop_automation("자동화 모드: F12 입력으로 중단되었습니다.")
-                else:
-                    self.ui2_controller.run_f6()
-            self._run_on_ui("2", _handle_f12)
+        """Handle global hotkey press.
+
+        Runs on the pynput listener thread, so it only looks up the handler
+        and queues it for the Tk main loop.
+        """
+        handler = self._hotkey_handlers.get(key)
+        if handler is not None:
+            self._post_main_event(handler)
+
+    def _on_f9(self) -> None:
+        """F9: run UI1 step one."""
+        self._switch_and_run("1", self.macro_controller.reset_and_run_first)
+
+    def _toggle_f10(self) -> None:
+        """F10: start or stop the channel detection sequence."""
+        self._switch_ui("1")
+        if self.channel_detection_sequence.running:
+            self.channel_detection_sequence.stop()
+            self.macro_controller.cancel()
+            self.status_var.set("F10 매크로가 종료되었습니다.")
+            self.macro_controller._update_status()
+        else:
+            self.channel_detection_sequence.start(self.newline_var.get())
+
+    def _on_f11(self) -> None:
+        """F11: run the UI2 F4 logic."""
+        self._switch_and_run("2", self.ui2_controller.run_f4)
+
+    def _handle_f12(self) -> None:
+        """F12: stop UI2 automation, or run F6 when automation is off."""
+        self._switch_ui("2")
+        if self.ui2_controller.state.active and self.ui2_automation_var.get():
+            self.ui2_controller.stop_automation("자동화 모드: F12 입력으로 중단되었습니다.")
+        else:
+            self.ui2_controller.run_f6()
 
     # State collection
     def _collect_app_state(self) -> dict:
@@ -725,23 +887,66 @@ class MakrApplication:
 
     def _on_close(self) -> None:
         """Handle application close."""
-        save_app_state(self._collect_app_state())
-        if self._hotkey_listener is not None:
-            self._hotkey_listener.stop()
-        self.channel_detection_sequence.stop()
-        self.ui2_controller.f4_automation_task.stop()
-        self.ui2_controller.repeater_f5.stop()
-        self.ui2_controller.repeater_f6.stop()
-        self.beep_notifier.stop()
-        self._stop_packet_capture()
-        self.root.destroy()
+        # Widgets are read here; the file write overlaps the teardown below.
+        state = self._collect_app_state()
+        save_errors: list[OSError] = []
+        saver = threading.Thread(
+            target=self._write_app_state_worker,
+            args=(state, save_errors),
+            name="makr-save",
+            daemon=True,
+        )
+        saver.start()
+        try:
+            if self._devlogic_alert_after_id is not None:
+                self.root.after_cancel(self._devlogic_alert_after_id)
+                self._devlogic_alert_after_id = None
+            if self._hotkey_listener is not None:
+                self._hotkey_listener.stop()
+            self.channel_detection_sequence.stop()
+            shutdown_input()
+            self.ui2_controller.f4_automation_task.stop()
+            self.ui2_controller.repeater_f5.stop()
+            self.ui2_controller.repeater_f6.stop()
+            self.beep_notifier.stop()
+            self._stop_packet_capture()
+            saver.join()
+            if save_errors:
+                # Retry on the main thread while the window is still shown,
+                # so the warning dialog has a visible parent.
+                save_app_state(state)
+        finally:
+            self.root.destroy()
+
+    @staticmethod
+    def _write_app_state_worker(state: dict, errors: list[OSError]) -> None:
+        """Write the app state, recording an OSError for the main thread."""
+        try:
+            write_app_state(state)
+        except OSError as exc:
+            errors.append(exc)
 
     def run(self) -> None:
         """Run the application."""
         self.root.mainloop()
 
 
+_gui_running = False
+
+
 def build_gui() -> None:
-    """Build and run the GUI (backward compatible entry point)."""
-    app = MakrApplication()
-    app.run()
+    """Build and run the GUI (backward compatible entry point).
+
+    Calls made while a window is already running (e.g. re-entrantly from a
+    callback) are ignored so no second Tk root is created; once the window
+    closes, the GUI can be launched again.
+    """
+    global _gui_running
+    if _gui_running:
+        return
+    _gui_running = True
+    try:
+        app = MakrApplication()
+        app.run()
+    finally:
+        _gui_running = False
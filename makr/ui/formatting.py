@@ -0,0 +1,21 @@
+"""Display formatting helpers shared by the UI windows."""
+
+from __future__ import annotations
+
+import time
+
+# (whole second, "HH:MM:SS") of the last formatted timestamp
+_last_second: tuple[int, str] = (-1, "")
+
+
+def format_timestamp(ts: float) -> str:
+    """Format a timestamp as HH:MM:SS.mmm."""
+    global _last_second
+    ts_int = int(ts)
+    second, prefix = _last_second
+    if second != ts_int:
+        # Records arrive in bursts; localtime/strftime only run once per second.
+        prefix = time.strftime("%H:%M:%S", time.localtime(ts_int))
+        _last_second = (ts_int, prefix)
+    millis = int((ts - ts_int) * 1000)
+    return f"{prefix}.{millis:03d}"
@@ -18,7 +18,7 @@ class UI1Panel(tk.Frame):
     def __init__(
         self,
         parent: tk.Widget,
-        saved_state: dict,
+        saved_coordinates: dict[str, tuple[str, str]],
         status_var: tk.StringVar,
         root: tk.Tk,
         pos3_mode_var: tk.IntVar,
@@ -31,7 +31,7 @@ class UI1Panel(tk.Frame):
         bg: str = "#ffffff",
     ) -> None:
         super().__init__(parent, bg=bg)
-        self.saved_state = saved_state
+        self.saved_coordinates = saved_coordinates
         self.status_var = status_var
         self.root = root
         self.pos3_mode_var = pos3_mode_var
@@ -70,13 +70,11 @@ class UI1Panel(tk.Frame):
         self.newline_checkbox = newline_checkbox
 
         # Coordinate rows
-        saved_coords = self.saved_state.get("coordinates", {})
-
-        self._add_coordinate_row("메뉴", "pos1", saved_coords)
-        self._add_coordinate_row("채널", "pos2", saved_coords)
+        self._add_coordinate_row("메뉴", "pos1")
+        self._add_coordinate_row("채널", "pos2")
         self._add_pos3_row("열")
-        self._add_coordinate_row("∇", "pos4", saved_coords)
-        self._add_coordinate_row("Esc", "esc_click", saved_coords)
+        self._add_coordinate_row("∇", "pos4")
+        self._add_coordinate_row("Esc", "esc_click")
 
         # Delay settings
         delay_frame = tk.LabelFrame(self, text="딜레이 설정")
@@ -127,16 +125,14 @@ class UI1Panel(tk.Frame):
             ],
         )
 
-    def _add_coordinate_row(
-        self, label_text: str, key: str, saved_coords: dict
-    ) -> None:
+    def _add_coordinate_row(self, label_text: str, key: str) -> None:
         """Add a coordinate input row."""
-        coords = saved_coords.get(key, {})
+        initial_x, initial_y = self.saved_coordinates.get(key, ("0", "0"))
         row = CoordinateRow(
             self,
             label_text,
-            initial_x=str(coords.get("x", "0")),
-            initial_y=str(coords.get("y", "0")),
+            initial_x=initial_x,
+            initial_y=initial_y,
             status_var=self.status_var,
             root=self.root,
             on_capture_start=self._get_capture_listener,
@@ -18,7 +18,7 @@ class UI2Panel(tk.Frame):
     def __init__(
         self,
         parent: tk.Widget,
-        saved_state: dict,
+        saved_coordinates: dict[str, tuple[str, str]],
         status_var: tk.StringVar,
         root: tk.Tk,
         automation_var: tk.BooleanVar,
@@ -29,7 +29,7 @@ class UI2Panel(tk.Frame):
         bg: str = "#ffffff",
     ) -> None:
         super().__init__(parent, bg=bg)
-        self.saved_state = saved_state
+        self.saved_coordinates = saved_coordinates
         self.status_var = status_var
         self.root = root
         self.automation_var = automation_var
@@ -60,12 +60,10 @@ class UI2Panel(tk.Frame):
         test_checkbox.pack(side="right", padx=(0, 6))
 
         # Coordinate rows
-        saved_coords = self.saved_state.get("coordinates", {})
-
-        self._add_coordinate_row("···", "pos11", saved_coords)
-        self._add_coordinate_row("🔃", "pos12", saved_coords)
-        self._add_coordinate_row("로그인", "pos13", saved_coords)
-        self._add_coordinate_row("캐릭터", "pos14", saved_coords)
+        self._add_coordinate_row("···", "pos11")
+        self._add_coordinate_row("🔃", "pos12")
+        self._add_coordinate_row("로그인", "pos13")
+        self._add_coordinate_row("캐릭터", "pos14")
 
         # Delay settings
         delay_frame = tk.LabelFrame(self, text="딜레이 설정")
@@ -92,16 +90,14 @@ class UI2Panel(tk.Frame):
             "ms (클릭 간격)",
         )
 
-    def _add_coordinate_row(
-        self, label_text: str, key: str, saved_coords: dict
-    ) -> None:
+    def _add_coordinate_row(self, label_text: str, key: str) -> None:
         """Add a coordinate input row."""
-        coords = saved_coords.get(key, {})
+        initial_x, initial_y = self.saved_coordinates.get(key, ("0", "0"))
         row = CoordinateRow(
             self,
             label_text,
-            initial_x=str(coords.get("x", "0")),
-            initial_y=str(coords.get("y", "0")),
+            initial_x=initial_x,
+            initial_y=initial_y,
             status_var=self.status_var,
             root=self.root,
             on_capture_start=self._get_capture_listener,
@@ -2,19 +2,12 @@
 
 from __future__ import annotations
 
-import time
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable
 
 from makr.core.state import UI2RecordItem
-
-
-def format_timestamp(ts: float) -> str:
-    """Format a timestamp as HH:MM:SS.mmm."""
-    ts_int = int(ts)
-    millis = int((ts - ts_int) * 1000)
-    return time.strftime("%H:%M:%S", time.localtime(ts)) + f".{millis:03d}"
+from makr.ui.formatting import format_timestamp
 
 
 class RecordWindow:
@@ -77,9 +70,6 @@ class RecordWindow:
 
     def _close(self) -> None:
         """Close the window and clean up."""
-        if self.treeview is not None:
-            for item in self.treeview.get_children():
-                self.treeview.delete(item)
         self.treeview = None
         window = self.window
         self.window = None
@@ -105,8 +95,7 @@ class RecordWindow:
         """Refresh the treeview contents."""
         if self.treeview is None:
             return
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
+        self.treeview.delete(*self.treeview.get_children())
         for record_item in self.items:
             self.treeview.insert(
                 "",
@@ -2,26 +2,32 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import time
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
 from typing import Callable
 
 from makr.core.state import TestRecord
+from makr.ui.formatting import format_timestamp
 
 
-def format_timestamp(ts: float) -> str:
-    """Format a timestamp as HH:MM:SS.mmm."""
-    ts_int = int(ts)
-    millis = int((ts - ts_int) * 1000)
-    return time.strftime("%H:%M:%S", time.localtime(ts)) + f".{millis:03d}"
+@functools.lru_cache(maxsize=None)
+def _pattern_row_template(col_width: int) -> str:
+    """Return a format string that left-pads six cells to col_width."""
+    return " | ".join([f"{{:<{col_width}}}"] * 6)
 
 
 class TestWindow:
     """Manages the test window (채널목록) for channel pattern recording."""
 
     PATTERN_REGEX = re.compile(r"[A-Z][가-힣]\d{2,3}")
+    # New records are drawn at most this often while the window is open.
+    VIEW_FLUSH_MS = 50
+    # Only the most recent records are kept; older ones drop off the list.
+    MAX_RECORDS = 2000
 
     def __init__(
         self,
@@ -37,9 +43,25 @@ class TestWindow:
         self.detail_text: tk.Text | None = None
         self.pattern_table: ttk.Treeview | None = None
 
-        self.records: list[TestRecord] = []
+        self.records: deque[TestRecord] = deque(maxlen=self.MAX_RECORDS)
+        # "#" of the newest record; keeps counting when old records drop off.
+        self._record_serial = 0
         self.channel_names: list[str] = []
         self.channel_name_set: set[str] = set()
+        # Running max of len(channel_names) entries, kept in step with
+        # add_record so the pattern table never rescans every name.
+        self._pattern_col_width = 0
+        # Formatted full rows of channel_names at _table_width, shared by
+        # every record's pattern table text.
+        self._table_lines: list[str] = []
+        self._table_width = 0
+        # Number of channel_names currently shown in pattern_table.
+        self._pattern_table_count = 0
+        # Serial of the newest record currently shown in treeview.
+        self._treeview_serial = 0
+        self._view_flush_after_id: str | None = None
+        # 1-based position in records of the record rendered in detail_text.
+        self._detail_index: int | None = None
 
     def show(self) -> None:
         """Show the test window."""
@@ -128,17 +150,13 @@ class TestWindow:
 
     def _close(self) -> None:
         """Close the window and clean up."""
-        if self.treeview is not None:
-            for item in self.treeview.get_children():
-                self.treeview.delete(item)
+        if self._view_flush_after_id is not None:
+            self.root.after_cancel(self._view_flush_after_id)
+            self._view_flush_after_id = None
+        # Destroying the Toplevel frees its child widgets and the Tcl
+        # commands registered for our bound-method callbacks.
         self.treeview = None
-        if self.detail_text is not None:
-            self.detail_text.destroy()
         self.detail_text = None
-        if self.pattern_table is not None:
-            for item in self.pattern_table.get_children():
-                self.pattern_table.delete(item)
-            self.pattern_table.destroy()
         self.pattern_table = None
         window = self.window
         self.window = None
@@ -150,86 +168,166 @@ class TestWindow:
     def add_record(self, content: str) -> tuple[list[str], list[str]]:
         """Add a test record and return (all_matches, new_matches)."""
         matches = self.PATTERN_REGEX.findall(content)
-        new_names = [name for name in matches if name not in self.channel_name_set]
         if not matches:
             return [], []
 
+        # One pass: a name repeated within the same content is only new once.
+        seen = self.channel_name_set
+        new_names: list[str] = []
+        for name in matches:
+            if name not in seen:
+                seen.add(name)
+                new_names.append(name)
+
         if new_names:
-            for name in new_names:
-                self.channel_name_set.add(name)
-                self.channel_names.append(name)
+            self.channel_names.extend(new_names)
+            self._pattern_col_width = max(self._pattern_col_width, *map(len, new_names))
 
             timestamp = format_timestamp(time.time())
-            table_text, table_rows = self._build_pattern_table(self.channel_names)
-            display_content = (
-                f"{content}\n\n[추출된 패턴]\n{table_text}" if table_text else content
-            )
             record = TestRecord(
                 timestamp=timestamp,
                 content=content,
-                table_text=table_text,
-                display_content=display_content,
-                table_rows=table_rows,
+                name_count=len(self.channel_names),
+                col_width=self._pattern_col_width,
             )
             self.records.append(record)
+            self._record_serial += 1
 
-            if self.treeview is not None:
-                index = len(self.records)
-                item_id = self.treeview.insert(
-                    "", "end", values=(index, timestamp, display_content)
+            if self.treeview is not None and self._view_flush_after_id is None:
+                self._view_flush_after_id = self.root.after(
+                    self.VIEW_FLUSH_MS, self._flush_new_records
                 )
-                self.treeview.selection_set(item_id)
-                self._update_detail(index)
-                self._update_pattern_table()
 
         return matches, new_names
 
-    def _build_pattern_table(
-        self, names: list[str]
-    ) -> tuple[str | None, list[list[str]]]:
-        """Build the pattern table from names."""
-        if not names:
-            return None, []
-
-        col_width = max(len(match) for match in names)
-        rows_for_view: list[list[str]] = []
-        formatted_rows: list[str] = []
-        for idx in range(0, len(names), 6):
-            chunk = names[idx : idx + 6]
-            padded = chunk + [""] * (6 - len(chunk))
-            rows_for_view.append(padded)
-            formatted_rows.append(
-                " | ".join(
-                    cell.ljust(col_width) if cell else "".ljust(col_width)
-                    for cell in padded
-                )
-            )
+    def _flush_new_records(self) -> None:
+        """Draw records added since the last flush in one batch."""
+        self._view_flush_after_id = None
+        pending = min(self._record_serial - self._treeview_serial, len(self.records))
+        if self.treeview is None or pending <= 0:
+            return
 
-        return "\n".join(formatted_rows), rows_for_view
+        first_serial = self._record_serial - len(self.records) + 1
+        item_id = ""
+        for position in range(len(self.records) - pending, len(self.records)):
+            record = self.records[position]
+            item_id = self.treeview.insert(
+                "",
+                "end",
+                values=(
+                    first_serial + position,
+                    record.timestamp,
+                    self._record_display_content(record),
+                ),
+            )
+        children = self.treeview.get_children()
+        if len(children) > len(self.records):
+            # Mirror the records that fell off the front of the deque.
+            self.treeview.delete(*children[: len(children) - len(self.records)])
+        self._treeview_serial = self._record_serial
+        self.treeview.selection_set(item_id)
+        self._update_detail(len(self.records))
+        self._append_pattern_table_names()
+
+    @staticmethod
+    def _build_pattern_table(names: list[str]) -> list[list[str]]:
+        """Split names into 6-column rows, padding the last row."""
+        padded_names = names + [""] * (-len(names) % 6)
+        return [padded_names[idx : idx + 6] for idx in range(0, len(padded_names), 6)]
+
+    @staticmethod
+    def _format_pattern_row(row: list[str], col_width: int) -> str:
+        """Format one 6-cell pattern table row as text."""
+        return _pattern_row_template(col_width).format(*row)
+
+    def _record_table_text(self, record: TestRecord) -> str | None:
+        """Return the pattern table text as it stood when record was added.
+
+        Full rows are formatted once and shared between records; only the
+        record's partial last row is formatted per call.
+        """
+        count = record.name_count
+        if not count:
+            return None
+        width = record.col_width
+        full_rows = count // 6
+        names = self.channel_names
+        if width == self._pattern_col_width:
+            lines = self._table_lines
+            if self._table_width != width:
+                lines.clear()
+                self._table_width = width
+            for row_idx in range(len(lines), full_rows):
+                lines.append(
+                    self._format_pattern_row(names[row_idx * 6 : row_idx * 6 + 6], width)
+                )
+            lines = lines[:full_rows]
+        else:
+            # Record from before the column width last grew.
+            lines = [
+                self._format_pattern_row(row, width)
+                for row in self._build_pattern_table(names[: full_rows * 6])
+            ]
+        if count % 6:
+            (last_row,) = self._build_pattern_table(names[full_rows * 6 : count])
+            lines.append(self._format_pattern_row(last_row, width))
+        return "\n".join(lines)
+
+    def _record_display_content(self, record: TestRecord) -> str:
+        """Return the record list text: content followed by its pattern table."""
+        table_text = self._record_table_text(record)
+        if not table_text:
+            return record.content
+        return f"{record.content}\n\n[추출된 패턴]\n{table_text}"
 
     def _update_pattern_table(self) -> None:
-        """Update the pattern table display."""
+        """Rebuild the pattern table display from all channel names."""
         if self.pattern_table is None:
             return
 
-        for item in self.pattern_table.get_children():
-            self.pattern_table.delete(item)
+        self.pattern_table.delete(*self.pattern_table.get_children())
+        self._pattern_table_count = len(self.channel_names)
 
-        _, rows = self._build_pattern_table(self.channel_names)
+        rows = self._build_pattern_table(self.channel_names)
 
         if not rows:
             self.pattern_table.insert("", "end", values=("(없음)", "", "", "", "", ""))
             return
 
         for row in rows:
-            padded = row + [""] * (6 - len(row))
-            self.pattern_table.insert("", "end", values=padded)
+            self.pattern_table.insert("", "end", values=row)
+
+    def _append_pattern_table_names(self) -> None:
+        """Show names appended since the last update without rebuilding the table.
+
+        Only the partially filled last row is rewritten; whole new rows are
+        inserted below it.
+        """
+        if self.pattern_table is None:
+            return
+        shown = self._pattern_table_count
+        if shown == 0 or shown > len(self.channel_names):
+            self._update_pattern_table()
+            return
+        if shown == len(self.channel_names):
+            return
+
+        first_row = shown // 6
+        rows = self._build_pattern_table(self.channel_names[first_row * 6 :])
+        if shown % 6:
+            last_item = self.pattern_table.get_children()[-1]
+            self.pattern_table.item(last_item, values=rows[0])
+            rows = rows[1:]
+        for row in rows:
+            self.pattern_table.insert("", "end", values=row)
+        self._pattern_table_count = len(self.channel_names)
 
     def _update_detail(self, selected_index: int | None = None) -> None:
         """Update the detail text for the selected record."""
         if self.detail_text is None:
             return
 
+        self._detail_index = selected_index
         self.detail_text.configure(state="normal")
         self.detail_text.delete("1.0", "end")
 
@@ -239,35 +337,38 @@ class TestWindow:
             or selected_index > len(self.records)
         ):
             self.detail_text.insert("1.0", "기록을 선택하세요.")
-            self._update_pattern_table()
         else:
             record = self.records[selected_index - 1]
-            patterns = record.table_text or "(없음)"
+            patterns = self._record_table_text(record) or "(없음)"
             detail = f"{record.content}\n\n[추출된 패턴]\n{patterns}"
             self.detail_text.insert("1.0", detail)
 
-        self._update_pattern_table()
         self.detail_text.configure(state="disabled")
 
     def _refresh_treeview(self) -> None:
         """Refresh the treeview contents."""
         if self.treeview is None:
             return
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-        for idx, record in enumerate(self.records, start=1):
+        self.treeview.delete(*self.treeview.get_children())
+        first_serial = self._record_serial - len(self.records) + 1
+        for idx, record in enumerate(self.records, start=first_serial):
             self.treeview.insert(
-                "", "end", values=(idx, record.timestamp, record.display_content)
+                "", "end", values=(idx, record.timestamp, self._record_display_content(record))
             )
+        self._treeview_serial = self._record_serial
         self._update_detail(1 if self.records else None)
+        self._update_pattern_table()
 
     def _clear_records(self) -> None:
         """Clear all records."""
         self.channel_names.clear()
         self.channel_name_set.clear()
+        self._pattern_col_width = 0
+        self._table_lines.clear()
+        self._table_width = 0
         self.records.clear()
+        self._record_serial = 0
         self._refresh_treeview()
-        self._update_pattern_table()
         self.status_var.set("테스트 기록이 초기화되었습니다.")
 
     def _on_select_record(self, event: tk.Event) -> None:
@@ -275,14 +376,15 @@ class TestWindow:
         if self.treeview is None:
             return
         selection = self.treeview.selection()
-        if not selection:
-            self._update_detail(None)
-            return
-        item_id = selection[0]
-        values = self.treeview.item(item_id, "values")
-        try:
-            idx = int(values[0])
-        except (ValueError, IndexError):
-            self._update_detail(None)
-            return
-        self._update_detail(idx)
+        idx: int | None = None
+        if selection:
+            # Resolve by the row's "#" serial: while a flush is pending the
+            # deque may already have dropped records the rows still show.
+            serial = int(self.treeview.set(selection[0], "index"))
+            oldest_serial = self._record_serial - len(self.records) + 1
+            if oldest_serial <= serial <= self._record_serial:
+                idx = serial - oldest_serial + 1
+        # Positions shift when records drop off, so only skip the redraw
+        # when no flush is pending.
+        if idx != self._detail_index or self._view_flush_after_id is not None:
+            self._update_detail(idx)